@@ -1,10 +1,9 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import time
 import io
 import os
-import plotly.io as pio
+import hashlib
 from dotenv import load_dotenv
 
 # .env 파일 로드
@@ -17,12 +16,14 @@ EMAIL_SENDER = os.getenv("EMAIL_SENDER", "")
 EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD", "")
 DEFAULT_RECIPIENT = os.getenv("DEFAULT_RECIPIENT", "")
 
+# 부트스트랩 난수 시드 (같은 데이터/설정이면 항상 같은 신뢰구간과 p-value)
+BOOTSTRAP_SEED = 42
+
 
 # 커스텀 모듈 임포트
 from utils.data_processor import DataProcessor
-from utils.statistical_tester import StatisticalTester
-from utils.visualizer import Visualizer
-from utils.reporter import Reporter
+# StatisticalTester(scipy, statsmodels), Visualizer(plotly 등)와 Reporter(jinja2, smtplib 등)는
+# 무거우므로 처음 필요한 시점에 임포트
 
 # 페이지 설정
 st.set_page_config(
@@ -33,7 +34,7 @@ st.set_page_config(
 )
 
 # 스타일 설정
-st.markdown("""
+APP_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -112,7 +113,14 @@ st.markdown("""
         font-style: italic;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource(show_spinner=False)
+def inject_css():
+    """스타일시트 주입 (캐시된 요소를 재실행 시 그대로 재생하여 매번 다시 생성하지 않음)"""
+    st.markdown(APP_CSS, unsafe_allow_html=True)
+
+inject_css()
 
 # 상태 초기화
 if 'data_processor' not in st.session_state:
@@ -129,6 +137,10 @@ if 'columns_set' not in st.session_state:
     st.session_state.columns_set = False
 if 'analysis_run' not in st.session_state:
     st.session_state.analysis_run = False
+if 'analysis_config' not in st.session_state:
+    st.session_state.analysis_config = None
+if 'uploaded_file_id' not in st.session_state:
+    st.session_state.uploaded_file_id = None
 
 # 유틸리티 함수
 def display_success(message):
@@ -147,16 +159,116 @@ def display_insight(message):
     """인사이트 메시지 표시"""
     st.markdown(f'<div class="insight-box">{message}</div>', unsafe_allow_html=True)
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def load_csv(fingerprint: str, _file_bytes: bytes) -> pd.DataFrame:
+    """업로드된 CSV 바이트 파싱 (동일 파일은 재실행 시 캐시 사용)
+    
+    캐시 키는 파일 바이트 전체가 아니라 미리 계산한 지문(fingerprint)을 사용합니다.
+    """
+    return DataProcessor.read_csv(io.BytesIO(_file_bytes))
+
+@st.cache_data(show_spinner=False)
+def run_analysis(_data: pd.DataFrame, fingerprint: str, group_col: str, target_col: str, alpha: float,
+                 bootstrap_samples: int, chi_square: bool, include_pearson: bool) -> dict:
+    """통계 분석 파이프라인 실행 (동일한 입력이면 캐시된 결과 반환)
+    
+    데이터프레임은 해싱하지 않고 데이터 지문(fingerprint)을 캐시 키로 사용합니다.
+    """
+    from utils.statistical_tester import StatisticalTester
+    
+    data_processor = DataProcessor()
+    data_processor.set_dataframe(_data, fingerprint)
+    data_processor.set_group_and_target(group_col, target_col)
+    
+    # 시드를 고정해 캐시가 비워진 뒤 다시 계산해도 같은 부트스트랩 결과가 나오도록 함
+    tester = StatisticalTester(data_processor, seed=BOOTSTRAP_SEED)
+    tester.set_alpha(alpha)
+    
+    analysis = {
+        "results": tester.run_all_tests(n_bootstrap=bootstrap_samples),
+        "chi_square_results": None,
+        "chi_square_error": None,
+        "pearson_results": None,
+        "pearson_error": None
+    }
+    
+    # 추가 옵션에 따른 분석
+    if chi_square:
+        try:
+            analysis["chi_square_results"] = tester.chi_square_test()
+        except Exception as e:
+            analysis["chi_square_error"] = str(e)
+    
+    if include_pearson and len(data_processor.groups) == 2:
+        try:
+            analysis["pearson_results"] = tester.pearson_correlation(n_resamples=bootstrap_samples)
+        except Exception as e:
+            analysis["pearson_error"] = str(e)
+    
+    return analysis
+
+@st.cache_data(show_spinner=False)
+def group_summary(_data_processor: DataProcessor, fingerprint: str, group_col: str, target_col: str) -> pd.DataFrame:
+    """그룹별 기초 통계 (같은 데이터와 열 조합이면 세션 간에도 캐시된 결과 사용)"""
+    return _data_processor.get_group_summary()
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def build_figure(_visualizer, fingerprint: str, analysis_key: tuple, plot_name: str):
+    """Plotly 그림 생성 (같은 데이터와 분석 스냅샷이면 캐시된 그림 재사용)"""
+    return getattr(_visualizer, plot_name)()
+
+def cached_figure(plot_name: str):
+    """현재 세션의 Visualizer로 그림 가져오기"""
+    data_processor = st.session_state.data_processor
+    analysis_key = (
+        data_processor.group_col,
+        data_processor.target_col,
+        st.session_state.statistical_tester.alpha,
+        st.session_state.analysis_config
+    )
+    return build_figure(st.session_state.visualizer, data_processor.fingerprint, analysis_key, plot_name)
+
+@st.cache_data(show_spinner=False)
+def generate_sample_data(num_groups: int, samples_per_group: int, effect_size: float) -> pd.DataFrame:
+    """A/B 테스트 샘플 데이터 생성 (그룹별로 전환율, 체류 시간, 매출 생성)"""
+    # 그룹 생성
+    groups = [chr(65 + i) for i in range(num_groups)]  # A, B, C, ...
+    
+    # 데이터 생성
+    rng = np.random.default_rng(42)  # 재현성을 위한 시드 설정
+    size = (num_groups, samples_per_group)
+    group_index = np.arange(num_groups)[:, None]
+    
+    # 그룹별로 다른 효과 크기 적용 (첫 그룹은 0, 마지막 그룹은 effect_size)
+    group_effect = effect_size * group_index / max(num_groups - 1, 1)
+    
+    # 모든 그룹의 샘플을 열마다 한 번의 호출로 생성 (행: 그룹, 열: 샘플)
+    conv_rates = rng.normal(0.1 + group_effect, 0.05, size)            # 전환율 (기본 전환율 0.1)
+    times_spent = rng.normal(100 - group_index * 10, 20, size)         # 체류 시간
+    revenues = rng.normal(40 + group_index * 5, 10, size)              # 매출
+    
+    # 데이터프레임은 한 번에 생성
+    return pd.DataFrame({
+        'group': np.repeat(groups, samples_per_group),
+        'conversion_rate': np.clip(conv_rates, 0, 1).ravel().round(3),   # 0~1 범위로 제한
+        'time_spent': np.maximum(times_spent, 10).ravel().round(1),      # 최소 10초
+        'revenue': np.maximum(revenues, 0).ravel().round(2)              # 최소 0
+    })
+
+@st.cache_data(show_spinner=False)
+def sample_data_csv(num_groups: int, samples_per_group: int, effect_size: float) -> bytes:
+    """샘플 데이터를 CSV 바이트로 변환 (같은 설정이면 캐시된 결과 사용)"""
+    csv_buffer = io.BytesIO()
+    generate_sample_data(num_groups, samples_per_group, effect_size).to_csv(csv_buffer, index=False)
+    return csv_buffer.getvalue()
+
 def reset_state():
-    """앱 상태 초기화"""
-    st.session_state.data_processor = None
-    st.session_state.statistical_tester = None
-    st.session_state.visualizer = None
-    st.session_state.reporter = None
-    st.session_state.data_loaded = False
-    st.session_state.columns_set = False
-    st.session_state.analysis_run = False
-    st.experimental_rerun()
+    """앱 상태 초기화 (키를 제거하면 재실행 시 상단의 상태 초기화 코드가 기본값을 다시 설정)"""
+    for key in ("data_processor", "statistical_tester", "visualizer", "reporter",
+                "data_loaded", "columns_set", "analysis_run", "analysis_config", "uploaded_file_id",
+                "chi_square_results", "pearson_results", "email_future"):
+        st.session_state.pop(key, None)
+    st.rerun()
 
 #----- 메인 애플리케이션 -----#
 
@@ -180,10 +292,21 @@ with st.sidebar:
     if uploaded_file is not None:
         # 데이터 로드
         try:
-            # DataProcessor 인스턴스 생성 및 데이터 로드
+            # 다른 파일이 업로드되면 이전 데이터와 분석 상태를 버리고 다시 로드
+            if st.session_state.uploaded_file_id != uploaded_file.file_id:
+                st.session_state.uploaded_file_id = uploaded_file.file_id
+                st.session_state.data_loaded = False
+                st.session_state.columns_set = False
+                st.session_state.analysis_run = False
+                st.session_state.analysis_config = None
+            
+            # DataProcessor 인스턴스 생성 및 데이터 로드 (파일당 한 번만 파싱)
             if not st.session_state.data_loaded:
                 st.session_state.data_processor = DataProcessor()
-                data = st.session_state.data_processor.load_data(uploaded_file)
+                file_bytes = uploaded_file.getvalue()
+                # 파일 바이트로 한 번만 지문을 계산해 이후 모든 캐시 키로 재사용
+                fingerprint = hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+                data = st.session_state.data_processor.set_dataframe(load_csv(fingerprint, file_bytes), fingerprint)
                 valid, message = st.session_state.data_processor.validate_data()
                 
                 if valid:
@@ -198,36 +321,46 @@ with st.sidebar:
                 
                 # 그룹 열 선택
                 all_columns = st.session_state.data_processor.data.columns.tolist()
-                categorical_cols = st.session_state.data_processor.get_column_types()["categorical"]
-                numeric_cols = st.session_state.data_processor.get_column_types()["numeric"]
-                
-                # 범주형 열만 있으면 그룹 열로 추천
-                group_col_suggestion = categorical_cols[0] if categorical_cols else all_columns[0]
-                group_col = st.selectbox(
-                    "그룹 열 선택 (실험 그룹을 구분하는 열)",
-                    all_columns,
-                    index=all_columns.index(group_col_suggestion) if group_col_suggestion in all_columns else 0
-                )
+                column_types = st.session_state.data_processor.get_column_types()
+                categorical_cols = column_types["categorical"]
+                numeric_cols = column_types["numeric"]
                 
-                # 종속변수 열 선택 (수치형 열만 표시)
-                target_col_suggestion = numeric_cols[0] if numeric_cols else all_columns[0]
-                target_col = st.selectbox(
-                    "종속변수 열 선택 (측정하려는 지표)",
-                    all_columns,
-                    index=all_columns.index(target_col_suggestion) if target_col_suggestion in all_columns else 0
-                )
+                # 열 선택 위젯은 폼으로 묶어 "열 설정 적용"을 누를 때 한 번만 재실행
+                with st.form("column_config"):
+                    # 범주형 열만 있으면 그룹 열로 추천
+                    group_col_suggestion = categorical_cols[0] if categorical_cols else all_columns[0]
+                    group_col = st.selectbox(
+                        "그룹 열 선택 (실험 그룹을 구분하는 열)",
+                        all_columns,
+                        index=all_columns.index(group_col_suggestion) if group_col_suggestion in all_columns else 0
+                    )
+                    
+                    # 종속변수 열 선택 (수치형 열만 표시)
+                    target_col_suggestion = numeric_cols[0] if numeric_cols else all_columns[0]
+                    target_col = st.selectbox(
+                        "종속변수 열 선택 (측정하려는 지표)",
+                        all_columns,
+                        index=all_columns.index(target_col_suggestion) if target_col_suggestion in all_columns else 0
+                    )
+                    
+                    columns_submitted = st.form_submit_button("열 설정 적용")
                 
                 # 열 설정 적용
-                if st.button("열 설정 적용"):
+                if columns_submitted:
                     try:
                         st.session_state.data_processor.set_group_and_target(group_col, target_col)
                         
+                        from utils.statistical_tester import StatisticalTester
+                        from utils.visualizer import Visualizer
+                        from utils.reporter import Reporter
+                        
                         # StatisticalTester 및 Visualizer 인스턴스 생성
                         st.session_state.statistical_tester = StatisticalTester(st.session_state.data_processor)
                         st.session_state.visualizer = Visualizer(st.session_state.data_processor, st.session_state.statistical_tester)
                         st.session_state.reporter = Reporter(st.session_state.data_processor, st.session_state.statistical_tester, st.session_state.visualizer)
                         
                         st.session_state.columns_set = True
+                        st.session_state.analysis_config = None
                         st.success(f"그룹 열: '{group_col}', 종속변수 열: '{target_col}'이(가) 설정되었습니다.")
                     except Exception as e:
                         st.error(f"열 설정 중 오류 발생: {str(e)}")
@@ -236,41 +369,55 @@ with st.sidebar:
                 if st.session_state.columns_set:
                     st.subheader("3. 분석 옵션")
                     
-                    # 유의수준 설정
-                    alpha = st.slider("유의수준 (α)", min_value=0.01, max_value=0.1, value=0.05, step=0.01)
-                    st.session_state.statistical_tester.set_alpha(alpha)
-                    
-                    # 부트스트랩 리샘플링 수
-                    bootstrap_samples = st.slider("부트스트랩 리샘플링 수", min_value=100, max_value=5000, value=1000, step=100)
+                    # 분석 옵션은 폼으로 묶어 위젯 조작마다가 아니라 "분석 실행" 시에만 재실행
+                    with st.form("analysis_config"):
+                        # 유의수준 설정
+                        alpha = st.slider("유의수준 (α)", min_value=0.01, max_value=0.1, value=0.05, step=0.01)
+                        
+                        # 부트스트랩 리샘플링 수
+                        bootstrap_samples = st.slider("부트스트랩 리샘플링 수", min_value=100, max_value=5000, value=1000, step=100)
+                        
+                        # 추가 분석 옵션
+                        with st.expander("추가 분석 옵션"):
+                            chi_square = st.checkbox("카이제곱 검정 수행 (이진화 분석)", value=False)
+                            include_pearson = st.checkbox("피어슨 상관계수 계산 (두 그룹인 경우)", value=False)
+                        
+                        # 분석 실행 버튼
+                        analysis_submitted = st.form_submit_button("분석 실행")
                     
-                    # 추가 분석 옵션
-                    with st.expander("추가 분석 옵션"):
-                        chi_square = st.checkbox("카이제곱 검정 수행 (이진화 분석)", value=False)
-                        include_pearson = st.checkbox("피어슨 상관계수 계산 (두 그룹인 경우)", value=False)
+                    st.session_state.statistical_tester.set_alpha(alpha)
                     
-                    # 분석 실행 버튼
-                    if st.button("분석 실행"):
+                    if analysis_submitted:
                         with st.spinner("분석 중..."):
-                            # 모든 테스트 실행
-                            st.session_state.statistical_tester.run_all_tests()
+                            # 모든 테스트 실행 (동일한 입력이면 캐시된 결과 사용)
+                            data_processor = st.session_state.data_processor
+                            analysis = run_analysis(
+                                data_processor.data,
+                                data_processor.fingerprint,
+                                data_processor.group_col,
+                                data_processor.target_col,
+                                alpha,
+                                bootstrap_samples,
+                                chi_square,
+                                include_pearson
+                            )
+                            st.session_state.statistical_tester.restore_results(analysis["results"])
+                            # 이전 분석으로 만든 보고서는 새 결과와 맞지 않으므로 폐기
+                            st.session_state.reporter.clear_report()
                             
-                            # 추가 옵션에 따른 분석
+                            # 추가 옵션에 따른 분석 결과
                             if chi_square:
-                                try:
-                                    st.session_state.chi_square_results = st.session_state.statistical_tester.chi_square_test()
-                                except Exception as e:
-                                    st.warning(f"카이제곱 검정 중 오류 발생: {str(e)}")
-                                    st.session_state.chi_square_results = None
+                                if analysis["chi_square_error"] is not None:
+                                    st.warning(f"카이제곱 검정 중 오류 발생: {analysis['chi_square_error']}")
+                                st.session_state.chi_square_results = analysis["chi_square_results"]
                             
-                            if include_pearson and len(st.session_state.data_processor.groups) == 2:
-                                try:
-                                    st.session_state.pearson_results = st.session_state.statistical_tester.pearson_correlation()
-                                except Exception as e:
-                                    st.warning(f"피어슨 상관계수 계산 중 오류 발생: {str(e)}")
-                                    st.session_state.pearson_results = None
+                            if include_pearson and len(data_processor.groups) == 2:
+                                if analysis["pearson_error"] is not None:
+                                    st.warning(f"피어슨 상관계수 계산 중 오류 발생: {analysis['pearson_error']}")
+                                st.session_state.pearson_results = analysis["pearson_results"]
                             
                             st.session_state.analysis_run = True
-                            time.sleep(0.5)  # 약간의 지연으로 스피너 표시
+                            st.session_state.analysis_config = (alpha, bootstrap_samples, chi_square, include_pearson)
                         
                         st.success("분석이 완료되었습니다! 결과를 확인하세요.")
                     
@@ -297,15 +444,27 @@ if st.session_state.data_loaded:
     # 데이터 탭과 결과 탭
     tab1, tab2, tab3, tab4, tab5 = st.tabs(["결과 요약", "데이터 개요", "기본 가정 검정", "가설 검정", "심화 분석"])
     
+    # 여러 탭에서 공통으로 사용하는 가설 정보는 실행마다 한 번만 생성
+    hypothesis = st.session_state.statistical_tester.get_null_alternative_hypothesis() if st.session_state.analysis_run else None
+    
     # 결과 요약 탭
-    with tab1:
+    @st.fragment(run_every=1)
+    def render_email_status():
+        """이메일 전송이 끝날 때까지 주기적으로 상태를 확인하고, 완료되면 결과 표시를 위해 다시 실행"""
+        email_future = st.session_state.get('email_future')
+        if email_future is not None and email_future.done():
+            st.rerun()
+        st.info("이메일 전송 중...")
+    
+    @st.fragment
+    def render_summary_tab(hypothesis):
+        """결과 요약 탭 렌더링 (탭 내부 위젯 조작 시 이 탭만 다시 실행)"""
         if st.session_state.analysis_run:
             st.markdown('<div class="sub-header">A/B 테스트 결과 요약</div>', unsafe_allow_html=True)
             
             # 필요한 데이터 가져오기
             hypothesis_test = st.session_state.statistical_tester.hypothesis_test_results
             effect_size = st.session_state.statistical_tester.effect_size_results
-            hypothesis = st.session_state.statistical_tester.get_null_alternative_hypothesis()
             
             # 주요 정보 추출
             test_name = hypothesis_test.get("test_name", "알 수 없음")
@@ -380,7 +539,7 @@ if st.session_state.data_loaded:
             
             # 효과 크기 게이지 차트는 시각적 정보로서 가치가 있으므로 유지
             try:
-                effect_fig = st.session_state.visualizer.plot_effect_size()
+                effect_fig = cached_figure("plot_effect_size")
                 st.plotly_chart(effect_fig, use_container_width=True, key="summary_effect_size_chart")
             except Exception as e:
                 st.error(f"효과 크기 시각화 중 오류 발생: {str(e)}")
@@ -396,7 +555,8 @@ if st.session_state.data_loaded:
                     ci_up = diff_result["ci_upper"]
                     
                     st.info(f"""
-                    **부트스트랩 95% 신뢰구간**: [{ci_low:.3f}, {ci_up:.3f}]
+                    **부트스트랩 95% 신뢰구간**: [{ci_low:.3f}, {ci_up:.3f}]  
+                    **부트스트랩 검정 p-value** (Welch t 기준): {diff_result['p_value']:.4f}
                     
                     신뢰구간이 0을 포함{'하지 않으므로' if diff_result['significant'] else '하므로'} 
                     부트스트랩 방법으로도 결과가 {'유의합니다.' if diff_result['significant'] else '유의하지 않습니다.'}
@@ -426,13 +586,20 @@ if st.session_state.data_loaded:
             if st.button("보고서 생성"):
                 with st.spinner("HTML 보고서 생성 중..."):
                     try:
-                        report_html = st.session_state.reporter.generate_report()
-                        download_link = st.session_state.reporter.download_report()
-                        st.markdown(download_link, unsafe_allow_html=True)
-                        st.success("HTML 보고서가 성공적으로 생성되었습니다. 위 링크를 클릭하여 다운로드하세요.")
+                        st.session_state.reporter.generate_report()
+                        st.success("HTML 보고서가 성공적으로 생성되었습니다. 아래 버튼을 클릭하여 다운로드하세요.")
                     except Exception as e:
                         st.error(f"보고서 생성 중 오류 발생: {str(e)}")
             
+            # 생성된 보고서는 base64 링크 대신 원본 바이트로 다운로드 제공
+            if st.session_state.reporter.report_html is not None:
+                st.download_button(
+                    "보고서 다운로드",
+                    data=st.session_state.reporter.report_html.encode("utf-8"),
+                    file_name="ab_test_report.html",
+                    mime="text/html"
+                )
+            
             # 이메일 전송 섹션
             with st.expander("이메일로 보고서 전송"):
                 st.markdown("보고서를 이메일로 전송하려면 아래 정보를 입력하세요.")
@@ -472,27 +639,39 @@ if st.session_state.data_loaded:
                     if not recipient_email:
                         st.error("수신자 이메일을 입력해주세요.")
                     else:
-                        with st.spinner("이메일 전송 중..."):
-                            try:
-                                success = st.session_state.reporter.send_email(
-                                    recipient_email=recipient_email,
-                                    subject=subject,
-                                    message=additional_message,
-                                    smtp_server=smtp_server,
-                                    smtp_port=smtp_port,
-                                    sender_email=sender_email,
-                                    sender_password=sender_password
-                                )
-                                
-                                if success:
-                                    st.success("HTML 보고서가 이메일로 성공적으로 전송되었습니다.")
-                                else:
-                                    st.error("이메일 전송에 실패했습니다.")
-                            except Exception as e:
-                                st.error(f"이메일 전송 중 오류 발생: {str(e)}")
+                        # 전송은 백그라운드 스레드에서 진행하고 화면은 바로 반환
+                        st.session_state.email_future = st.session_state.reporter.send_email_async(
+                            recipient_email=recipient_email,
+                            subject=subject,
+                            message=additional_message,
+                            smtp_server=smtp_server,
+                            smtp_port=smtp_port,
+                            sender_email=sender_email,
+                            sender_password=sender_password
+                        )
+                
+                # 이메일 전송 상태 표시
+                email_future = st.session_state.get('email_future')
+                if email_future is not None:
+                    if email_future.done():
+                        del st.session_state.email_future
+                        try:
+                            if email_future.result():
+                                st.success("HTML 보고서가 이메일로 성공적으로 전송되었습니다.")
+                            else:
+                                st.error("이메일 전송에 실패했습니다.")
+                        except Exception as e:
+                            st.error(f"이메일 전송 중 오류 발생: {str(e)}")
+                    else:
+                        render_email_status()
+    
+    with tab1:
+        render_summary_tab(hypothesis)
     
     # 데이터 개요 탭
-    with tab2:
+    @st.fragment
+    def render_data_overview_tab():
+        """데이터 개요 탭 렌더링 (탭 내부 위젯 조작 시 이 탭만 다시 실행)"""
         st.markdown('<div class="sub-header">데이터 미리보기</div>', unsafe_allow_html=True)
         st.dataframe(st.session_state.data_processor.data.head(10))
         
@@ -508,13 +687,20 @@ if st.session_state.data_loaded:
         
         if st.session_state.columns_set:
             st.markdown('<div class="sub-header">그룹별 기초 통계</div>', unsafe_allow_html=True)
-            st.dataframe(st.session_state.data_processor.get_group_summary())
+            data_processor = st.session_state.data_processor
+            summary = group_summary(
+                data_processor,
+                data_processor.fingerprint,
+                data_processor.group_col,
+                data_processor.target_col
+            )
+            st.dataframe(summary)
             
             # 그룹별 샘플 수 확인 및 경고
-            group_counts = st.session_state.data_processor.get_group_summary()['개수'].to_dict()
-            small_groups = {group: count for group, count in group_counts.items() if count < 30}
+            group_counts = summary['개수']
+            small_groups = group_counts[group_counts < 30]
             
-            if small_groups:
+            if len(small_groups) > 0:
                 warning_msg = "다음 그룹은 샘플 수가 30개 미만으로, 통계적 검정력이 낮을 수 있습니다: "
                 warning_msg += ", ".join([f"'{group}' ({count}개)" for group, count in small_groups.items()])
                 display_warning(warning_msg)
@@ -533,20 +719,25 @@ if st.session_state.data_loaded:
                 try:
                     # 선택된 그래프 유형에 따라 다른 시각화 함수 호출
                     if plot_type == "Violin Plot":
-                        dist_fig = st.session_state.visualizer.plot_distribution_comparison()
+                        dist_fig = cached_figure("plot_distribution_comparison")
                     elif plot_type == "Histogram":
-                        dist_fig = st.session_state.visualizer.plot_distribution_comparison_histogram()
+                        dist_fig = cached_figure("plot_distribution_comparison_histogram")
                     elif plot_type == "Ridgeline Plot":
-                        dist_fig = st.session_state.visualizer.plot_distribution_comparison_ridgeline()
+                        dist_fig = cached_figure("plot_distribution_comparison_ridgeline")
                     elif plot_type == "Box Plot":
-                        dist_fig = st.session_state.visualizer.plot_distribution_comparison_boxplot()
+                        dist_fig = cached_figure("plot_distribution_comparison_boxplot")
                     
                     st.plotly_chart(dist_fig, use_container_width=True)
                 except Exception as e:
                     st.error(f"분포 시각화 중 오류 발생: {str(e)}")
     
+    with tab2:
+        render_data_overview_tab()
+    
     # 기본 가정 검정 탭
-    with tab3:
+    @st.fragment
+    def render_assumption_tab():
+        """기본 가정 검정 탭 렌더링 (탭 내부 위젯 조작 시 이 탭만 다시 실행)"""
         if st.session_state.columns_set:
             st.markdown('<div class="sub-header">정규성 검정</div>', unsafe_allow_html=True)
             st.markdown("""
@@ -560,27 +751,23 @@ if st.session_state.data_loaded:
             else:
                 normality_results = st.session_state.statistical_tester.normality_results
             
-            # 정규성 결과 표시
-            normality_df = pd.DataFrame({
-                '그룹': [],
-                'Shapiro-Wilk 통계량': [],
-                'p-value': [],
-                '정규성': []
-            })
-
+            # 정규성 결과 표시 (행을 모은 뒤 한 번에 데이터프레임 생성)
+            normality_rows = []
             for group, result in normality_results.items():
-                if result["shapiro"]["statistic"] is not None:
-                    normality_df = pd.concat([
-                        normality_df,
-                        pd.DataFrame({
-                            '그룹': [group],
-                            'Shapiro-Wilk 통계량': [f"{result['shapiro']['statistic']:.4f}"],  # 소수점 4자리 제한
-                            'p-value': [f"{result['shapiro']['p_value']:.4f}"],  # 소수점 4자리 제한
-                            '정규성': ["만족" if result["shapiro"]["normal"] else "불만족"]
-                        })
-                    ])
+                shapiro = result["shapiro"]
+                if shapiro["statistic"] is None:
+                    continue
+                normality_rows.append({
+                    '그룹': group,
+                    'Shapiro-Wilk 통계량': shapiro['statistic'],
+                    'p-value': shapiro['p_value'],
+                    '정규성': "만족" if shapiro["normal"] else "불만족"
+                })
+            
+            normality_df = pd.DataFrame(normality_rows, columns=['그룹', 'Shapiro-Wilk 통계량', 'p-value', '정규성'])
 
-            st.dataframe(normality_df)
+            # 값은 수치형으로 유지하고 표시 형식만 소수점 4자리로 제한
+            st.dataframe(normality_df.style.format({'Shapiro-Wilk 통계량': "{:.4f}", 'p-value': "{:.4f}"}))
             
             # Q-Q 플롯
             st.markdown('<div class="sub-header">Q-Q 플롯 (정규성 검정)</div>', unsafe_allow_html=True)
@@ -590,7 +777,7 @@ if st.session_state.data_loaded:
             """)
             
             try:
-                qq_fig = st.session_state.visualizer.plot_qq_plots()
+                qq_fig = cached_figure("plot_qq_plots")
                 st.plotly_chart(qq_fig, use_container_width=True)
             except Exception as e:
                 st.error(f"Q-Q 플롯 생성 중 오류 발생: {str(e)}")
@@ -611,15 +798,15 @@ if st.session_state.data_loaded:
             # 등분산성 결과 표시
             homogeneity_df = pd.DataFrame({
                 '검정': ['Bartlett', 'Levene'],
-                '통계량': [f"{homogeneity_results['bartlett']['statistic']:.4f}", 
-                        f"{homogeneity_results['levene']['statistic']:.4f}"],  # 소수점 4자리 제한
-                'p-value': [f"{homogeneity_results['bartlett']['p_value']:.4f}", 
-                            f"{homogeneity_results['levene']['p_value']:.4f}"],  # 소수점 4자리 제한
+                '통계량': [homogeneity_results['bartlett']['statistic'], 
+                        homogeneity_results['levene']['statistic']],
+                'p-value': [homogeneity_results['bartlett']['p_value'], 
+                            homogeneity_results['levene']['p_value']],
                 '등분산성': ["만족" if homogeneity_results["bartlett"]["equal_variances"] else "불만족",
                         "만족" if homogeneity_results["levene"]["equal_variances"] else "불만족"]
             })
 
-            st.dataframe(homogeneity_df)
+            st.dataframe(homogeneity_df.style.format({'통계량': "{:.4f}", 'p-value': "{:.4f}"}))
             
             # 정규성 및 등분산성 요약
             all_normal = all(result["shapiro"]["normal"] for result in normality_results.values() if result["shapiro"]["normal"] is not None)
@@ -633,12 +820,16 @@ if st.session_state.data_loaded:
             else:
                 display_warning("일부 또는 모든 그룹이 정규성을 만족하지 않습니다. 비모수적 검정(Mann-Whitney U, Kruskal-Wallis 등)을 사용하는 것이 좋습니다.")
     
+    with tab3:
+        render_assumption_tab()
+    
     # 가설 검정 탭
-    with tab4:
+    @st.fragment
+    def render_hypothesis_tab(hypothesis):
+        """가설 검정 탭 렌더링 (탭 내부 위젯 조작 시 이 탭만 다시 실행)"""
         if st.session_state.analysis_run:
             # 가설 설정
             st.markdown('<div class="sub-header">가설 설정</div>', unsafe_allow_html=True)
-            hypothesis = st.session_state.statistical_tester.get_null_alternative_hypothesis()
             
             st.markdown(f"""
             **귀무가설 (H₀)**: {hypothesis['null']}  
@@ -648,7 +839,7 @@ if st.session_state.data_loaded:
             # 그룹별 평균 비교
             st.markdown('<div class="sub-header">그룹별 평균 비교</div>', unsafe_allow_html=True)
             try:
-                mean_fig = st.session_state.visualizer.plot_mean_comparison()
+                mean_fig = cached_figure("plot_mean_comparison")
                 st.plotly_chart(mean_fig, use_container_width=True)
             except Exception as e:
                 st.error(f"평균 비교 시각화 중 오류 발생: {str(e)}")
@@ -706,7 +897,7 @@ if st.session_state.data_loaded:
             """)
             
             try:
-                effect_fig = st.session_state.visualizer.plot_effect_size()
+                effect_fig = cached_figure("plot_effect_size")
                 st.plotly_chart(effect_fig, use_container_width=True)
             except Exception as e:
                 st.error(f"효과 크기 시각화 중 오류 발생: {str(e)}")
@@ -749,8 +940,13 @@ if st.session_state.data_loaded:
         else:
             display_warning("분석을 실행해주세요. 사이드바에서 '분석 실행' 버튼을 클릭하세요.")
     
+    with tab4:
+        render_hypothesis_tab(hypothesis)
+    
     # 심화 분석 탭
-    with tab5:
+    @st.fragment
+    def render_advanced_tab():
+        """심화 분석 탭 렌더링 (탭 내부 위젯 조작 시 이 탭만 다시 실행)"""
         if st.session_state.analysis_run:
             # 부트스트랩 분석
             st.markdown('<div class="sub-header">부트스트랩 신뢰구간 분석</div>', unsafe_allow_html=True)
@@ -762,7 +958,7 @@ if st.session_state.data_loaded:
             bootstrap_results = st.session_state.statistical_tester.bootstrap_results
             
             try:
-                bootstrap_fig = st.session_state.visualizer.plot_bootstrap_ci()
+                bootstrap_fig = cached_figure("plot_bootstrap_ci")
                 st.plotly_chart(bootstrap_fig, use_container_width=True)
             except Exception as e:
                 st.error(f"부트스트랩 시각화 중 오류 발생: {str(e)}")
@@ -776,7 +972,7 @@ if st.session_state.data_loaded:
             """)
             
             try:
-                error_fig = st.session_state.visualizer.plot_error_matrix()
+                error_fig = cached_figure("plot_error_matrix")
                 st.plotly_chart(error_fig, use_container_width=True)
             except Exception as e:
                 st.error(f"오류 매트릭스 시각화 중 오류 발생: {str(e)}")
@@ -789,6 +985,7 @@ if st.session_state.data_loaded:
                 st.markdown(f"""
                 **피어슨 상관계수(r)**: {pearson['pearson_r']:.4f}  
                 **p-value**: {pearson['p_value']:.4f}  
+                **95% 부트스트랩 신뢰구간**: [{pearson['ci_lower']:.4f}, {pearson['ci_upper']:.4f}]  
                 **유의성**: {"유의함" if pearson['significant'] else "유의하지 않음"}  
                 **해석**: {pearson['interpretation']}
                 """)
@@ -809,6 +1006,9 @@ if st.session_state.data_loaded:
     
         else:
             display_warning("분석을 실행해주세요. 사이드바에서 '분석 실행' 버튼을 클릭하세요.")
+    
+    with tab5:
+        render_advanced_tab()
 else:
     # 데이터가 로드되지 않은 경우 가이드 표시
     st.markdown('<div class="section">', unsafe_allow_html=True)
@@ -867,52 +1067,16 @@ else:
     
     if st.button("샘플 데이터 생성"):
         try:
-            # 그룹 생성
-            groups = [chr(65 + i) for i in range(num_groups)]  # A, B, C, ...
-            
-            # 데이터 생성
-            np.random.seed(42)  # 재현성을 위한 시드 설정
-            
-            data = []
-            
-            for i, group in enumerate(groups):
-                # 기본 전환율
-                base_conv = 0.1
-                # 그룹별로 다른 효과 크기 적용
-                if i > 0:
-                    group_effect = effect_size * (i / (num_groups - 1)) if num_groups > 1 else effect_size
-                else:
-                    group_effect = 0
-                
-                # 각 그룹별 샘플 생성
-                for _ in range(samples_per_group):
-                    # 전환율
-                    conv_rate = np.random.normal(base_conv + group_effect, 0.05)
-                    conv_rate = max(0, min(1, conv_rate))  # 0~1 범위로 제한
-                    
-                    # 체류 시간
-                    time_spent = np.random.normal(100 - i*10, 20)
-                    time_spent = max(10, time_spent)  # 최소 10초
-                    
-                    # 매출
-                    revenue = np.random.normal(40 + i*5, 10)
-                    revenue = max(0, revenue)  # 최소 0
-                    
-                    data.append({
-                        'group': group,
-                        'conversion_rate': round(conv_rate, 3),
-                        'time_spent': round(time_spent, 1),
-                        'revenue': round(revenue, 2)
-                    })
-            
-            # 데이터프레임 생성
-            sample_df = pd.DataFrame(data)
+            sample_df = generate_sample_data(num_groups, samples_per_group, effect_size)
             
-            # CSV 다운로드 링크 생성
-            csv = sample_df.to_csv(index=False)
-            b64 = base64.b64encode(csv.encode()).decode()
-            href = f'<a href="data:file/csv;base64,{b64}" download="ab_test_sample_data.csv">샘플 데이터 다운로드</a>'
-            st.markdown(href, unsafe_allow_html=True)
+            # CSV 다운로드 버튼 (다운로드 클릭 시 재실행하지 않음)
+            st.download_button(
+                label="샘플 데이터 다운로드",
+                data=sample_data_csv(num_groups, samples_per_group, effect_size),
+                file_name="ab_test_sample_data.csv",
+                mime="text/csv",
+                on_click="ignore"
+            )
             
             # 데이터 미리보기
             st.markdown("#### 샘플 데이터 미리보기")
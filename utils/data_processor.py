@@ -1,8 +1,12 @@
 import pandas as pd
 import numpy as np
-from typing import Tuple, List, Dict, Optional, Union
+from typing import Tuple, List, Dict, Optional, Union, Iterator
 import io
-from scipy import stats
+import os
+import hashlib
+
+# 이보다 큰 CSV는 pyarrow 엔진으로 파싱 (작은 파일은 스레드 풀 기동 비용이 더 큼)
+PYARROW_MIN_BYTES = 1024 * 1024
 
 class DataProcessor:
     """데이터 로딩 및 전처리를 위한 클래스"""
@@ -12,36 +16,123 @@ class DataProcessor:
         self.group_col = None
         self.target_col = None
         self.groups = None
+        self.is_binary_target = False  # 타겟이 0/1 값만 가지는지 여부 (전환 여부 등)
+        self.fingerprint = None  # 캐시 키로 사용하는 데이터 지문
+        self._validation = None
+        self._column_types = None
+        self._group_codes = None
+        self._group_arrays = None
+        self._group_index = None
+        self._plot_arrays = None
+        self._stacked_values = None
+        self._stacked_labels = None
+        self._group_series_map = None
+        self._reweighed = None
+        self._group_moments = None
+        self._group_summary = None
+        
+    @staticmethod
+    def read_csv(file_obj) -> pd.DataFrame:
+        """CSV 파싱 (1MB를 넘는 파일 경로나 바이너리 파일 객체는 멀티스레드 pyarrow 엔진 사용)"""
+        is_path = isinstance(file_obj, (str, os.PathLike))
+        size = 0
+        if is_path:
+            size = os.path.getsize(file_obj)
+        elif hasattr(file_obj, "seek") and hasattr(file_obj, "tell"):
+            file_obj.seek(0, io.SEEK_END)
+            size = file_obj.tell()
+            file_obj.seek(0)
         
+        if size > PYARROW_MIN_BYTES and not isinstance(file_obj, io.StringIO):
+            try:
+                return pd.read_csv(file_obj, engine="pyarrow")
+            except Exception:
+                # pyarrow 미설치 또는 지원하지 않는 형식일 경우 C 엔진으로 재시도
+                if not is_path:
+                    file_obj.seek(0)
+        
+        # 파일 경로는 메모리 맵으로 읽어 중간 버퍼 복사를 줄임
+        return pd.read_csv(file_obj, engine="c", low_memory=False, memory_map=is_path)
+    
     def load_data(self, file_obj) -> pd.DataFrame:
         """CSV 파일을 로드하고 기본 검증 수행"""
         try:
-            # 파일 객체가 StringIO이거나 BytesIO일 경우 처리
-            if isinstance(file_obj, (io.StringIO, io.BytesIO)):
-                self.data = pd.read_csv(file_obj)
-            else:
-                self.data = pd.read_csv(file_obj)
-                
-            # 기본 검증: 비어있는 데이터프레임인지 확인
-            if self.data.empty:
-                raise ValueError("업로드된 CSV 파일이 비어 있습니다.")
-                
-            return self.data
-        except Exception as e:
-            raise ValueError(f"CSV 파일 로딩 중 오류 발생: {str(e)}")
+            data = self.read_csv(file_obj)
+        except pd.errors.EmptyDataError as e:
+            raise ValueError("업로드된 CSV 파일이 비어 있습니다.") from e
+        except (pd.errors.ParserError, UnicodeDecodeError) as e:
+            raise ValueError(f"CSV 파일 파싱 중 오류 발생: {str(e)}") from e
+        except OSError as e:
+            raise ValueError(f"CSV 파일 로딩 중 오류 발생: {str(e)}") from e
+        
+        return self.set_dataframe(data)
+    
+    def set_dataframe(self, df: pd.DataFrame, fingerprint: Optional[str] = None) -> pd.DataFrame:
+        """이미 파싱된 데이터프레임을 설정하고 기본 검증 수행
+        
+        Args:
+            df: 파싱된 데이터프레임
+            fingerprint: 데이터 지문 (예: 원본 CSV 바이트의 해시). 없으면 데이터프레임에서 한 번 계산
+        """
+        # 기본 검증: 비어있는 데이터프레임인지 확인
+        if df.empty:
+            raise ValueError("업로드된 CSV 파일이 비어 있습니다.")
+        
+        if fingerprint is None:
+            row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+            fingerprint = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+        
+        self.data = df
+        self.fingerprint = fingerprint
+        # 새 데이터이므로 캐시 무효화
+        self._validation = None
+        self._column_types = None
+        self._group_codes = None
+        self._group_arrays = None
+        self._group_index = None
+        self._plot_arrays = None
+        self._stacked_values = None
+        self._stacked_labels = None
+        self._group_series_map = None
+        self._reweighed = None
+        self._group_moments = None
+        self._group_summary = None
+        return self.data
     
     def validate_data(self) -> Tuple[bool, str]:
         """데이터의 유효성 검증"""
         if self.data is None:
             return False, "데이터가 로드되지 않았습니다."
         
+        # 같은 데이터프레임에 대해서는 한 번만 검증
+        if self._validation is None:
+            self._validation = self._validate()
+        
+        return self._validation
+    
+    def _validate(self) -> Tuple[bool, str]:
+        """행 수와 결측치 검사"""
         # 최소 행 수 체크
         if len(self.data) < 10:
             return False, "데이터 행 수가 너무 적습니다. 최소 10개 이상의 데이터가 필요합니다."
         
-        # 결측치 확인
-        missing_values = self.data.isnull().sum().sum()
-        if missing_values > 0:
+        # 결측치 확인: 실수형 열은 np.isnan으로, 나머지 열은 isna로 존재 여부만 먼저 검사
+        # (NumPy 정수/불리언 열은 결측치를 가질 수 없으므로 검사 생략)
+        float_cols = []
+        other_cols = []
+        for col, dtype in self.data.dtypes.items():
+            if isinstance(dtype, np.dtype) and dtype.kind == "f":
+                float_cols.append(col)
+            elif not (isinstance(dtype, np.dtype) and dtype.kind in "iub"):
+                other_cols.append(col)
+        
+        has_missing = bool(float_cols) and np.isnan(self.data[float_cols].to_numpy()).any()
+        if not has_missing and other_cols:
+            has_missing = self.data[other_cols].isna().to_numpy().any()
+        
+        # 결측치가 있을 때만 정확한 개수 계산
+        if has_missing:
+            missing_values = self.data.isnull().sum().sum()
             return False, f"데이터에 결측치가 {missing_values}개 있습니다. 전처리 후 다시 시도해주세요."
         
         return True, "데이터 검증 완료"
@@ -51,13 +142,25 @@ class DataProcessor:
         if self.data is None:
             return {"numeric": [], "categorical": []}
         
-        numeric_cols = self.data.select_dtypes(include=np.number).columns.tolist()
-        categorical_cols = self.data.select_dtypes(include=['object', 'category']).columns.tolist()
+        # 같은 데이터프레임에 대해서는 한 번만 계산
+        if self._column_types is None:
+            # dtype 목록을 한 번만 순회하며 수치형/범주형 열을 함께 분류
+            numeric_cols = []
+            categorical_cols = []
+            for col, dtype in self.data.dtypes.items():
+                # TRUE/FALSE 형태의 열은 bool로 파싱되므로 범주형으로 분류
+                if (pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_object_dtype(dtype)
+                        or pd.api.types.is_string_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype)):
+                    categorical_cols.append(col)
+                elif pd.api.types.is_numeric_dtype(dtype):
+                    numeric_cols.append(col)
+            
+            self._column_types = {
+                "numeric": numeric_cols,
+                "categorical": categorical_cols
+            }
         
-        return {
-            "numeric": numeric_cols,
-            "categorical": categorical_cols
-        }
+        return self._column_types
     
     def set_group_and_target(self, group_col: str, target_col: str) -> None:
         """그룹 열과 타겟 열 설정"""
@@ -70,52 +173,201 @@ class DataProcessor:
         if target_col not in self.data.columns:
             raise ValueError(f"'{target_col}' 열이 데이터에 존재하지 않습니다.")
         
-        self.group_col = group_col
-        self.target_col = target_col
-        self.groups = sorted(self.data[group_col].unique())
-        
         # 데이터 유형 확인
         if self.data[target_col].dtype not in [np.float64, np.int64, np.float32, np.int32]:
             raise ValueError(f"'{target_col}' 열은 수치형 데이터여야 합니다.")
+        
+        # 그룹 열이 모두 결측이면 그룹이 없어 코드 타입 축소와 그룹 경계 계산이 성립하지 않음
+        if not self.data[group_col].notna().any():
+            raise ValueError(f"'{group_col}' 열에 유효한 그룹이 없습니다 (모든 값이 결측).")
+        
+        self.group_col = group_col
+        self.target_col = target_col
+        self._group_summary = None  # 열이 바뀌었으므로 요약 통계 캐시 무효화
+        
+        # 그룹 코드로 행을 한 번만 안정 정렬해 그룹별로 연속된 float64 구간으로 배치 (SoA 레이아웃)
+        # 각 그룹 배열은 정렬된 배열의 뷰이며, 그룹 내 행 순서는 원본 순서를 유지
+        codes, uniques = pd.factorize(self.data[group_col], sort=True)
+        # 그룹 코드를 가장 작은 정수 타입으로 줄이면 안정 정렬이 기수 정렬 경로를 타고 대역폭도 줄어듦
+        # (결측 그룹은 -1이므로 부호 있는 타입 사용)
+        codes = codes.astype(np.min_scalar_type(-len(uniques)), copy=False)
+        order = np.argsort(codes, kind="stable")
+        target_sorted = np.ascontiguousarray(self.data[target_col].to_numpy(dtype=np.float64)[order])
+        index_sorted = self.data.index[order]
+        
+        # 그룹 경계는 코드별 개수의 누적합으로 계산 (결측 그룹 행은 맨 앞에 정렬됨)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        bounds = np.count_nonzero(codes < 0) + np.concatenate(([0], np.cumsum(counts)))
+        
+        self.groups = uniques.tolist()
+        self._group_codes = codes
+        self.is_binary_target = bool(((target_sorted == 0) | (target_sorted == 1)).all())
+        self._group_arrays = {
+            group: target_sorted[bounds[i]:bounds[i + 1]] for i, group in enumerate(self.groups)
+        }
+        self._group_index = {
+            group: index_sorted[bounds[i]:bounds[i + 1]] for i, group in enumerate(self.groups)
+        }
+        self._plot_arrays = None
+        # 결측 그룹 행을 제외한, 그룹 순서대로 이어진 타겟 값 (그룹 배열들과 메모리 공유)
+        self._stacked_values = target_sorted[bounds[0]:]
+        self._stacked_labels = None
+        self._group_series_map = None
+        self._reweighed = None
+        
+        # 여러 검정에서 공통으로 쓰는 그룹별 표본 수/평균/분산/표준편차를 한 번에 계산
+        self._group_moments = self._compute_group_moments(uniques, counts, bounds)
+    
+    def _compute_group_moments(self, uniques: pd.Index, counts: np.ndarray, bounds: np.ndarray) -> pd.DataFrame:
+        """그룹별로 연속 배치된 타겟 값에서 표본 수/평균/분산/표준편차를 한 번의 합/제곱합 축약으로 계산
+        
+        각 그룹의 첫 값을 빼고(shift) 합과 제곱합을 누적하므로 평균이 큰 데이터에서도 분산의 상쇄 오차가 작습니다.
+        결측값이 있으면 pandas groupby 집계(결측값 제외)로 대체합니다.
+        """
+        values = self._stacked_values
+        if np.isnan(values).any():
+            return self.data.groupby(self.group_col)[self.target_col].agg(["count", "mean", "var", "std"])
+        
+        starts = bounds[:-1] - bounds[0]
+        shift = values[starts]
+        centered = values - np.repeat(shift, counts)
+        sums = np.add.reduceat(centered, starts)
+        sumsq = np.add.reduceat(centered * centered, starts)
+        
+        n = counts.astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            var = (sumsq - sums * sums / n) / (n - 1)  # 표본이 1개면 NaN (pandas와 동일)
+        var = np.maximum(var, 0.0)
+        
+        return pd.DataFrame(
+            {"count": counts.astype(np.int64), "mean": shift + sums / n, "var": var, "std": np.sqrt(var)},
+            index=pd.Index(uniques, name=self.group_col),
+        )
+    
+    def get_group_moments(self) -> pd.DataFrame:
+        """그룹별 표본 수(count), 평균(mean), 분산(var), 표준편차(std) 반환 (그룹 순서대로 정렬)"""
+        if self._group_moments is None:
+            raise ValueError("데이터, 그룹 열, 타겟 열이 모두 설정되어야 합니다.")
+        
+        return self._group_moments
+    
+    def get_group_arrays(self) -> Dict[str, np.ndarray]:
+        """모든 그룹의 타겟 데이터를 NumPy 배열로 반환 (set_group_and_target에서 미리 계산)"""
+        if self._group_arrays is None:
+            raise ValueError("데이터, 그룹 열, 타겟 열이 모두 설정되어야 합니다.")
+        
+        return self._group_arrays
+    
+    def get_plot_arrays(self) -> Dict[str, np.ndarray]:
+        """시각화용 그룹별 타겟 데이터 반환 (값 범위가 허용하면 float32로 축소)
+        
+        원시 데이터 포인트를 그리는 트레이스의 직렬화 크기를 절반으로 줄이기 위한 용도이며,
+        float32로 누적하면 분산 등이 부정확해지므로 통계 계산에는 get_group_arrays()를 사용해야 합니다.
+        """
+        if self._plot_arrays is None:
+            group_arrays = self.get_group_arrays()
+            values = np.concatenate(list(group_arrays.values()))
+            
+            if values.size and np.isfinite(values).all() and np.abs(values).max() < np.finfo(np.float32).max:
+                self._plot_arrays = {group: arr.astype(np.float32) for group, arr in group_arrays.items()}
+            else:
+                self._plot_arrays = group_arrays
+        
+        return self._plot_arrays
+    
+    def get_stacked_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        """모든 그룹의 타겟 값과 그룹 코드를 그룹 순서대로 이어 붙인 배열 반환 (ANOVA 등 long 형식 입력용)
+        
+        그룹 코드는 self.groups의 인덱스(정수)이며, 값 배열은 그룹 배열들과 같은 메모리를 공유하므로
+        복사나 파이썬 리스트 누적이 없습니다.
+        """
+        if self._stacked_values is None:
+            raise ValueError("데이터, 그룹 열, 타겟 열이 모두 설정되어야 합니다.")
+        
+        # 코드 배열은 처음 요청될 때 한 번만 만들고 재사용 (ANOVA와 효과 크기 계산이 함께 사용)
+        if self._stacked_labels is None:
+            sizes = [len(arr) for arr in self._group_arrays.values()]
+            codes = np.arange(len(self.groups), dtype=np.min_scalar_type(len(self.groups)))
+            self._stacked_labels = np.repeat(codes, sizes)
+        return self._stacked_values, self._stacked_labels
+    
+    def reweigh(self, group) -> Tuple[np.ndarray, np.ndarray]:
+        """그룹의 타겟 데이터를 (고유값, 빈도) 가중 표현으로 압축 (이산형·저카디널리티 지표용)"""
+        if self._reweighed is None:
+            self._reweighed = {}
+        
+        if group not in self._reweighed:
+            values, counts = np.unique(self.get_group_arrays()[group], return_counts=True)
+            self._reweighed[group] = (values.astype(np.float64), counts.astype(np.int64))
+        
+        return self._reweighed[group]
+    
+    def iter_group_arrays(self) -> Iterator[Tuple[str, np.ndarray]]:
+        """(그룹, NumPy 배열) 쌍을 그룹 순서대로 순회"""
+        return iter(self.get_group_arrays().items())
     
     def get_group_data(self, group_name: str = None) -> Union[pd.Series, Dict[str, pd.Series]]:
         """특정 그룹 또는 모든 그룹의 타겟 데이터 반환"""
         if self.data is None or self.group_col is None or self.target_col is None:
             raise ValueError("데이터, 그룹 열, 타겟 열이 모두 설정되어야 합니다.")
         
+        # 미리 분리해 둔 그룹 배열을 감싸기만 하므로 전체 데이터를 다시 스캔하지 않음
+        # 전체 그룹 dict는 한 번 만들어 두고 검정/시각화 호출 간에 재사용
+        if self._group_series_map is None:
+            self._group_series_map = {group: self._group_series(group) for group in self.groups}
+        
         if group_name:
-            return self.data[self.data[self.group_col] == group_name][self.target_col]
+            return self._group_series_map[group_name]
         else:
-            return {group: self.data[self.data[self.group_col] == group][self.target_col] 
-                    for group in self.groups}
+            return self._group_series_map
+    
+    def _group_series(self, group) -> pd.Series:
+        """그룹 배열을 원본 인덱스를 가진 Series로 감싸서 반환 (복사 없음)"""
+        return pd.Series(self._group_arrays[group], index=self._group_index[group], name=self.target_col, copy=False)
     
     def get_group_summary(self) -> pd.DataFrame:
         """각 그룹별 기본 통계 요약"""
         if self.data is None or self.group_col is None or self.target_col is None:
             raise ValueError("데이터, 그룹 열, 타겟 열이 모두 설정되어야 합니다.")
         
-        # scipy.stats를 사용하여 첨도(kurtosis) 계산
-        summary = self.data.groupby(self.group_col)[self.target_col].agg([
-            'count',            # 샘플 수
-            'mean',             # 평균
-            'std',              # 표준편차 
-            'min',              # 최소값
-            'max',              # 최대값
-            lambda x: x.quantile(0.25),  # 1사분위수
-            lambda x: x.quantile(0.5),   # 중앙값
-            lambda x: x.quantile(0.75),  # 3사분위수
-            'sem',              # 표준오차
-            'var',              # 분산
-            lambda x: stats.skew(x),     # 왜도 (scipy 사용)
-            lambda x: stats.kurtosis(x, fisher=True)  # 첨도 (scipy 사용)
-        ])
-        
-        # 열 이름 변경
-        summary.columns = [
-            '개수', '평균', '표준편차', '최소값', '최대값', 
-            '1사분위수', '중앙값', '3사분위수', '표준오차', '분산', '왜도', '첨도'
-        ]
+        # 같은 그룹/타겟 열에 대해서는 한 번만 계산
+        if self._group_summary is not None:
+            return self._group_summary
+        
+        grouped = self.data.groupby(self.group_col)[self.target_col]
+        
+        # 람다 집계 없이 pandas 내장(Cython) 집계만 사용
+        base = grouped.agg(['count', 'mean', 'std', 'min', 'max', 'sem', 'var'])
+        quantiles = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+        
+        # 왜도/첨도는 그룹별 중심적률로 계산 (scipy.stats.skew, kurtosis(fisher=True)의 기본값과 동일한 편향 추정량)
+        # 그룹 순서로 이어진 연속 배열에서 np.add.reduceat으로 모든 그룹의 적률을 한 번에 누적
+        values = self._stacked_values
+        sizes = np.array([len(arr) for arr in self._group_arrays.values()])
+        starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        means = np.add.reduceat(values, starts) / sizes
+        centered = values - np.repeat(means, sizes)
+        squared = centered ** 2
+        m2 = np.add.reduceat(squared, starts) / sizes
+        m3 = np.add.reduceat(squared * centered, starts) / sizes
+        m4 = np.add.reduceat(squared * squared, starts) / sizes
+        
+        summary = pd.DataFrame({
+            '개수': base['count'],
+            '평균': base['mean'],
+            '표준편차': base['std'],
+            '최소값': base['min'],
+            '최대값': base['max'],
+            '1사분위수': quantiles[0.25],
+            '중앙값': quantiles[0.5],
+            '3사분위수': quantiles[0.75],
+            '표준오차': base['sem'],
+            '분산': base['var'],
+            '왜도': m3 / m2 ** 1.5,
+            '첨도': m4 / m2 ** 2 - 3.0
+        })
         
+        self._group_summary = summary
         return summary
     
     def prepare_data_guide(self) -> str:
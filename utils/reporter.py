@@ -1,52 +1,22 @@
 import os
 import base64
-import smtplib
-import pandas as pd
-import plotly.graph_objects as go
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
-from typing import Dict, List, Optional, Any
+import hashlib
+import subprocess
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from functools import lru_cache
 import jinja2
+from markupsafe import escape
 import tempfile
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-import pdfkit
 
-class Reporter:
-    """A/B 테스트 결과 보고서 생성 및 이메일 전송 클래스"""
-    
-    def __init__(self, data_processor, statistical_tester, visualizer):
-        """
-        Args:
-            data_processor: DataProcessor 인스턴스
-            statistical_tester: StatisticalTester 인스턴스
-            visualizer: Visualizer 인스턴스
-        """
-        self.data_processor = data_processor
-        self.statistical_tester = statistical_tester
-        self.visualizer = visualizer
-        self.report_html = None
-    
-    def generate_simple_html_report(self) -> str:
-        """간소화된 HTML 보고서 생성 (PDF 변환 목적)"""
-        if not self.data_processor.groups:
-            raise ValueError("그룹 데이터가 설정되지 않았습니다.")
-        
-        # 필요한 경우 모든 테스트 실행
-        if not hasattr(self.statistical_tester, 'hypothesis_test_results') or not self.statistical_tester.hypothesis_test_results:
-            self.statistical_tester.run_all_tests()
-        
-        # 데이터 요약 및 기본 정보
-        summary = self.data_processor.get_group_summary()
-        hypothesis = self.statistical_tester.get_null_alternative_hypothesis()
-        test_results = self.statistical_tester.hypothesis_test_results
-        effect_size = self.statistical_tester.effect_size_results
-        
-        # 현재 날짜
-        current_date = datetime.now().strftime("%Y년 %m월 %d일")
-        
-        # 간소화된 HTML 보고서 템플릿
-        template_str = """
+if TYPE_CHECKING:
+    import smtplib
+    from email.mime.multipart import MIMEMultipart
+
+# 간소화된 HTML 보고서 템플릿 (PDF 변환 목적)
+_REPORT_TEMPLATE_STR = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -102,9 +72,9 @@ class Reporter:
                     font-weight: bold;
                     margin-top: 20px;
                     padding: 15px;
-                    background-color: {% if test_results.significant %}#e8f5e9{% else %}#fff3e0{% endif %};
+                    background-color: {{ conclusion_bg }};
                     border-radius: 5px;
-                    border-left: 5px solid {% if test_results.significant %}#4CAF50{% else %}#FF9800{% endif %};
+                    border-left: 5px solid {{ conclusion_border }};
                 }
                 .footer {
                     margin-top: 40px;
@@ -133,9 +103,9 @@ class Reporter:
             <div class="section summary">
                 <h2>결과 요약</h2>
                 <p><strong>검정 방법:</strong> {{ test_results.test_name }}</p>
-                <p><strong>p-value:</strong> {{ "%.4f"|format(test_results.p_value) }}</p>
-                <p><strong>통계적 유의성:</strong> {% if test_results.significant %}있음 (귀무가설 기각){% else %}없음 (귀무가설 채택){% endif %}</p>
-                <p><strong>효과 크기 ({{ effect_size.measure }}):</strong> {{ "%.4f"|format(effect_size.value) }}</p>
+                <p><strong>p-value:</strong> {{ p_value_str }}</p>
+                <p><strong>통계적 유의성:</strong> {{ significance_str }}</p>
+                <p><strong>효과 크기 ({{ effect_size.measure }}):</strong> {{ effect_value_str }}</p>
                 <p><strong>효과 크기 해석:</strong> {{ effect_size.interpretation }}</p>
                 
                 <div class="conclusion">
@@ -166,17 +136,7 @@ class Reporter:
                         <th>중앙값</th>
                         <th>최대값</th>
                     </tr>
-                    {% for group, stats in summary.iterrows() %}
-                    <tr>
-                        <td>{{ group }}</td>
-                        <td>{{ stats['개수']|int }}</td>
-                        <td>{{ "%.3f"|format(stats['평균']) }}</td>
-                        <td>{{ "%.3f"|format(stats['표준편차']) }}</td>
-                        <td>{{ "%.3f"|format(stats['최소값']) }}</td>
-                        <td>{{ "%.3f"|format(stats['중앙값']) }}</td>
-                        <td>{{ "%.3f"|format(stats['최대값']) }}</td>
-                    </tr>
-                    {% endfor %}
+                    {{ summary_rows_html|safe }}
                 </table>
             </div>
             
@@ -202,20 +162,14 @@ class Reporter:
                     </tr>
                     <tr>
                         <td>{{ test_results.test_name }}</td>
-                        <td>
-                            {% if "f_statistic" in test_results %}
-                                {{ "%.4f"|format(test_results.f_statistic) }}
-                            {% else %}
-                                {{ "%.4f"|format(test_results.statistic) }}
-                            {% endif %}
-                        </td>
-                        <td>{{ "%.4f"|format(test_results.p_value) }}</td>
-                        <td>{{ "%.2f"|format(alpha) }}</td>
-                        <td>{{ "귀무가설 기각 (유의함)" if test_results.significant else "귀무가설 채택 (유의하지 않음)" }}</td>
+                        <td>{{ statistic_str }}</td>
+                        <td>{{ p_value_str }}</td>
+                        <td>{{ alpha_str }}</td>
+                        <td>{{ result_str }}</td>
                     </tr>
                 </table>
                 
-                {% if 'post_hoc' in test_results and test_results.post_hoc.results %}
+                {% if post_hoc_rows_html %}
                 <h3>사후 검정 결과</h3>
                 <table>
                     <tr>
@@ -225,15 +179,7 @@ class Reporter:
                         <th>p-value</th>
                         <th>유의성</th>
                     </tr>
-                    {% for result in test_results.post_hoc.results %}
-                    <tr>
-                        <td>{{ result.group1 }}</td>
-                        <td>{{ result.group2 }}</td>
-                        <td>{% if 'meandiff' in result %}{{ "%.4f"|format(result.meandiff) }}{% else %}{{ "" }}{% endif %}</td>
-                        <td>{% if 'p_value' in result %}{{ "%.4f"|format(result.p_value) }}{% else %}{{ "%.4f"|format(result.pvalue) }}{% endif %}</td>
-                        <td>{% if 'reject' in result %}{{ "유의함" if result.reject else "유의하지 않음" }}{% else %}{{ "유의함" if result.significant else "유의하지 않음" }}{% endif %}</td>
-                    </tr>
-                    {% endfor %}
+                    {{ post_hoc_rows_html|safe }}
                 </table>
                 {% endif %}
             </div>
@@ -251,7 +197,7 @@ class Reporter:
                     </tr>
                     <tr>
                         <td>{{ effect_size.measure }}</td>
-                        <td>{{ "%.4f"|format(effect_size.value) }}</td>
+                        <td>{{ effect_value_str }}</td>
                         <td>{{ effect_size.interpretation }}</td>
                         <td>{{ effect_size.comparison }}</td>
                     </tr>
@@ -261,17 +207,17 @@ class Reporter:
             <!-- 결론 섹션 -->
             <div class="section">
                 <h2>결론 및 권장사항</h2>
-                <p>유의수준 {{ "%.2f"|format(alpha) }}에서 {{ test_results.test_name }}을(를) 수행한 결과,
-                p-value는 {{ "%.4f"|format(test_results.p_value) }}였습니다.</p>
+                <p>유의수준 {{ alpha_str }}에서 {{ test_results.test_name }}을(를) 수행한 결과,
+                p-value는 {{ p_value_str }}였습니다.</p>
                 
                 <div class="conclusion">
                     {% if test_results.significant %}
                     <p>귀무가설을 기각하고 대립가설을 지지하는 통계적으로 유의한 증거가 있습니다.</p>
-                    <p>측정된 효과 크기({{ effect_size.measure }})는 {{ "%.4f"|format(effect_size.value) }}이며, 이는 {{ effect_size.interpretation }} 수준의 효과입니다.</p>
+                    <p>측정된 효과 크기({{ effect_size.measure }})는 {{ effect_value_str }}이며, 이는 {{ effect_size.interpretation }} 수준의 효과입니다.</p>
                     <p><strong>권장사항:</strong> 실험 처치를 확대 적용하는 것이 권장됩니다.</p>
                     {% else %}
                     <p>귀무가설을 기각할 만한 통계적으로 유의한 증거가 없습니다.</p>
-                    <p>현재 효과 크기({{ "%.4f"|format(effect_size.value) }})를 고려할 때, 
+                    <p>현재 효과 크기({{ effect_value_str }})를 고려할 때, 
                     다음과 같은 조치를 고려해볼 수 있습니다:</p>
                     <ul>
                         <li>샘플 크기를 증가시켜 검정력을 높인다</li>
@@ -288,22 +234,138 @@ class Reporter:
         </body>
         </html>
         """
+
+# wkhtmltopdf 변환 옵션
+_PDF_OPTIONS = {
+    'page-size': 'A4',
+    'margin-top': '1cm',
+    'margin-right': '1cm',
+    'margin-bottom': '1cm',
+    'margin-left': '1cm',
+    'encoding': 'UTF-8',
+    'no-outline': None
+}
+
+# 보고서 템플릿 환경 (컴파일된 템플릿을 재사용)
+_TEMPLATE_ENV = jinja2.Environment(
+    autoescape=jinja2.select_autoescape(['html']),
+    trim_blocks=True,
+    lstrip_blocks=True
+)
+
+
+def _table_rows_html(rows) -> str:
+    """표의 각 행(셀 값 목록)을 <tr> HTML로 결합 (셀 값은 이스케이프)"""
+    return ''.join(
+        '<tr>' + ''.join(f"<td>{escape(cell)}</td>" for cell in row) + '</tr>\n'
+        for row in rows
+    )
+
+
+@lru_cache(maxsize=None)
+def _compile_template(template_str: str) -> jinja2.Template:
+    """템플릿 문자열을 한 번만 파싱/컴파일하고 이후에는 캐시된 템플릿 반환"""
+    return _TEMPLATE_ENV.from_string(template_str)
+
+class Reporter:
+    """A/B 테스트 결과 보고서 생성 및 이메일 전송 클래스"""
+    
+    # 이메일 전송용 스레드 풀 (처음 비동기 전송 시 생성, 모든 인스턴스가 공유)
+    _io_pool = None
+    
+    def __init__(self, data_processor, statistical_tester, visualizer):
+        """
+        Args:
+            data_processor: DataProcessor 인스턴스
+            statistical_tester: StatisticalTester 인스턴스
+            visualizer: Visualizer 인스턴스
+        """
+        self.data_processor = data_processor
+        self.statistical_tester = statistical_tester
+        self.visualizer = visualizer
+        self.report_html = None
+        # 마지막으로 생성한 PDF (동일한 HTML이면 재변환하지 않음)
+        self.report_pdf_bytes = None
+        self.report_pdf_filename = None
+        self.report_pdf_hash = None
+        # HTML 다운로드 링크 캐시 (보고서를 다시 생성하면 초기화)
+        self._download_link_cache = None
+        # 마지막 보고서 생성 시각
+        self._last_report_time = None
+    
+    def generate_simple_html_report(self) -> str:
+        """간소화된 HTML 보고서 생성 (PDF 변환 목적)"""
+        if not self.data_processor.groups:
+            raise ValueError("그룹 데이터가 설정되지 않았습니다.")
+        
+        # 필요한 경우 모든 테스트 실행
+        test_results = getattr(self.statistical_tester, 'hypothesis_test_results', None)
+        if not test_results:
+            self.statistical_tester.run_all_tests()
+            test_results = self.statistical_tester.hypothesis_test_results
+        
+        # 데이터 요약 및 기본 정보
+        summary = self.data_processor.get_group_summary()
+        # 기초 통계 표 행을 미리 HTML로 결합 (행마다 Series를 만들지 않도록 dict로 변환)
+        summary_rows_html = _table_rows_html(
+            [group, int(stats['개수'])] + [f"{stats[col]:.3f}" for col in ('평균', '표준편차', '최소값', '중앙값', '최대값')]
+            for group, stats in summary.to_dict('index').items()
+        )
+        hypothesis = self.statistical_tester.get_null_alternative_hypothesis()
+        effect_size = self.statistical_tester.effect_size_results
+        
+        # 사후 검정 결과 표 행을 미리 HTML로 결합
+        # (Tukey HSD는 'p-adj'/'reject', 비모수 검정은 'p_value'/'significant' 키 사용)
+        post_hoc_rows_html = _table_rows_html(
+            [
+                r['group1'],
+                r['group2'],
+                f"{r['meandiff']:.4f}" if 'meandiff' in r else '',
+                f"{r.get('p_value', r.get('pvalue', r.get('p-adj'))):.4f}",
+                '유의함' if r.get('reject', r.get('significant')) else '유의하지 않음'
+            ]
+            for r in test_results.get('post_hoc', {}).get('results', [])
+        )
+        
+        # 유의성에 따른 문구와 결론 박스 색상 (유의함: 초록, 유의하지 않음: 주황)
+        if test_results['significant']:
+            significance_str, result_str = '있음 (귀무가설 기각)', '귀무가설 기각 (유의함)'
+            conclusion_bg, conclusion_border = '#e8f5e9', '#4CAF50'
+        else:
+            significance_str, result_str = '없음 (귀무가설 채택)', '귀무가설 채택 (유의하지 않음)'
+            conclusion_bg, conclusion_border = '#fff3e0', '#FF9800'
+        
+        statistic = test_results['f_statistic'] if 'f_statistic' in test_results else test_results['statistic']
+        
+        # 보고서 생성 시각 (PDF 파일명에도 재사용)
+        report_time = datetime.now()
+        current_date = report_time.strftime("%Y년 %m월 %d일")
         
         # 템플릿 렌더링
-        template = jinja2.Template(template_str)
+        template = _compile_template(_REPORT_TEMPLATE_STR)
         try:
             report_html = template.render(
                 group_col=self.data_processor.group_col,
                 target_col=self.data_processor.target_col,
                 group_count=len(self.data_processor.groups),
-                summary=summary,
+                summary_rows_html=summary_rows_html,
                 hypothesis=hypothesis,
                 test_results=test_results,
                 effect_size=effect_size,
-                alpha=self.statistical_tester.alpha,
+                post_hoc_rows_html=post_hoc_rows_html,
+                statistic_str=f"{statistic:.4f}",
+                p_value_str=f"{test_results['p_value']:.4f}",
+                effect_value_str=f"{effect_size['value']:.4f}",
+                alpha_str=f"{self.statistical_tester.alpha:.2f}",
+                significance_str=significance_str,
+                result_str=result_str,
+                conclusion_bg=conclusion_bg,
+                conclusion_border=conclusion_border,
                 current_date=current_date
             )
             self.report_html = report_html
+            self._last_report_time = report_time
+            self._download_link_cache = None
             return report_html
         except Exception as e:
             raise ValueError(f"HTML 생성 중 오류 발생: {str(e)}")
@@ -317,66 +379,165 @@ class Reporter:
         # 파일 경로 지정
         if filepath is None:
             # 임시 파일 생성 (현재 날짜 포함)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filepath = f"ab_test_report_{timestamp}.pdf"
+            filepath = f"ab_test_report_{self._report_timestamp()}.pdf"
+        
+        import pdfkit
         
         try:
-            # HTML을 PDF로 변환 (pdfkit 사용)
-            # 옵션 설정
-            options = {
-                'page-size': 'A4',
-                'margin-top': '1cm',
-                'margin-right': '1cm',
-                'margin-bottom': '1cm',
-                'margin-left': '1cm',
-                'encoding': 'UTF-8',
-                'no-outline': None
-            }
+            # HTML을 임시 파일로 저장한 뒤 PDF로 변환 (stdin 파이프 경로보다 빠름)
+            with tempfile.NamedTemporaryFile(suffix='.html', mode='w', encoding='utf-8', delete=False) as f:
+                f.write(self.report_html)
+                html_path = f.name
+            
+            try:
+                # wkhtmltopdf 경로 자동 감지 (기본값)
+                pdfkit.from_file(html_path, filepath, options=_PDF_OPTIONS)
+            finally:
+                os.remove(html_path)
             
-            # wkhtmltopdf 경로 자동 감지 (기본값)
-            pdfkit.from_string(self.report_html, filepath, options=options)
+            # 다운로드/이메일 전송 시 재사용할 수 있도록 PDF 바이트 보관
+            with open(filepath, "rb") as f:
+                self.report_pdf_bytes = f.read()
+            self.report_pdf_filename = os.path.basename(filepath)
+            self.report_pdf_hash = self._report_html_hash()
             return filepath
         except Exception as e:
             raise ValueError(f"PDF 생성 중 오류 발생: {str(e)}")
     
+    def generate_pdf_reports_batch(self, html_list: List[str], out_dir: str) -> List[str]:
+        """여러 HTML 보고서를 하나의 wkhtmltopdf 프로세스로 PDF 변환
+        
+        보고서마다 프로세스를 새로 띄우지 않고 --read-args-from-stdin 모드로
+        한 프로세스에 변환 작업을 줄 단위로 전달합니다.
+        
+        Args:
+            html_list: 변환할 HTML 문자열 목록
+            out_dir: PDF를 저장할 디렉터리
+            
+        Returns:
+            생성된 PDF 파일 경로 목록 (html_list 순서와 동일)
+        """
+        if not html_list:
+            return []
+        
+        import pdfkit
+        
+        os.makedirs(out_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        # 옵션을 wkhtmltopdf 인자로 변환
+        option_args = []
+        for key, value in _PDF_OPTIONS.items():
+            option_args.append(f"--{key}")
+            if value is not None:
+                option_args.append(str(value))
+        
+        def quote(arg: str) -> str:
+            return '"' + arg.replace('\\', '\\\\').replace('"', '\\"') + '"'
+        
+        try:
+            binary = pdfkit.configuration().wkhtmltopdf
+            if isinstance(binary, bytes):
+                binary = binary.decode('utf-8')
+            
+            with tempfile.TemporaryDirectory() as html_dir:
+                lines = []
+                filepaths = []
+                for i, html in enumerate(html_list):
+                    html_path = os.path.join(html_dir, f"report_{i}.html")
+                    with open(html_path, "w", encoding="utf-8") as f:
+                        f.write(html)
+                    
+                    filepath = os.path.join(out_dir, f"ab_test_report_{timestamp}_{i}.pdf")
+                    filepaths.append(filepath)
+                    lines.append(" ".join(option_args + [quote(html_path), quote(filepath)]))
+                
+                subprocess.run(
+                    [binary, '--quiet', '--read-args-from-stdin'],
+                    input="\n".join(lines) + "\n",
+                    text=True,
+                    capture_output=True,
+                    check=True
+                )
+            return filepaths
+        except subprocess.CalledProcessError as e:
+            raise ValueError(f"PDF 일괄 생성 중 오류 발생: {e.stderr.strip()}") from e
+        except Exception as e:
+            raise ValueError(f"PDF 일괄 생성 중 오류 발생: {str(e)}") from e
+    
     def download_pdf_report(self) -> tuple:
         """PDF 보고서를 다운로드할 수 있는 바이트 데이터와 파일명 반환"""
-        # 임시 파일에 PDF 생성
-        temp_filepath = self.generate_pdf_report()
+        # 파일명과 바이트 데이터 반환
+        return self._get_pdf_bytes()
+    
+    def clear_report(self) -> None:
+        """생성된 보고서와 PDF·다운로드 링크 캐시를 비움 (분석 결과가 바뀌면 이전 보고서를 제공하지 않도록)"""
+        self.report_html = None
+        self.report_pdf_bytes = None
+        self.report_pdf_filename = None
+        self.report_pdf_hash = None
+        self._download_link_cache = None
+        self._last_report_time = None
+    
+    def _report_timestamp(self) -> str:
+        """파일명용 타임스탬프 (보고서 생성 시각 기준, 없으면 현재 시각)"""
+        report_time = self._last_report_time or datetime.now()
+        return report_time.strftime("%Y%m%d_%H%M%S")
+    
+    def _report_html_hash(self) -> str:
+        """현재 HTML 보고서의 해시"""
+        return hashlib.sha1(self.report_html.encode('utf-8')).hexdigest()
+    
+    def _get_pdf_bytes(self) -> Tuple[bytes, str]:
+        """PDF 바이트와 파일명 반환 (HTML이 바뀌지 않았으면 캐시된 PDF 사용)"""
+        if self.report_html is None:
+            self.generate_simple_html_report()
         
-        # 파일 읽기
-        with open(temp_filepath, "rb") as f:
-            pdf_bytes = f.read()
+        if self.report_pdf_bytes is not None and self.report_pdf_hash == self._report_html_hash():
+            return self.report_pdf_bytes, self.report_pdf_filename
         
-        # 임시 파일 삭제
-        try:
-            os.remove(temp_filepath)
-        except:
-            pass
+        # 임시 디렉터리에 PDF 생성 (바이트는 generate_pdf_report가 메모리에 보관)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.generate_pdf_report(os.path.join(temp_dir, f"ab_test_report_{self._report_timestamp()}.pdf"))
         
-        # 파일명과 바이트 데이터 반환
-        filename = os.path.basename(temp_filepath)
-        return pdf_bytes, filename
+        return self.report_pdf_bytes, self.report_pdf_filename
     
-    def send_email_with_pdf(self, recipient_email: str, subject: str = None, message: str = None,
-                         smtp_server: str = None, smtp_port: int = 587,
-                         sender_email: str = None, sender_password: str = None) -> bool:
-        """PDF 보고서를 이메일로 전송
+    @contextmanager
+    def smtp_session(self, smtp_server: str, smtp_port: int, sender_email: str, sender_password: str):
+        """여러 이메일을 하나의 SMTP 연결로 보내기 위한 세션
+        
+        Examples:
+            with reporter.smtp_session(server, 587, sender, password) as session:
+                for recipient in recipients:
+                    reporter.send_email_with_pdf(recipient, server=session)
+        """
+        import smtplib
+        
+        server = smtplib.SMTP(smtp_server, smtp_port)
+        try:
+            server.starttls()
+            server.login(sender_email, sender_password)
+            yield server
+        finally:
+            try:
+                server.quit()
+            except smtplib.SMTPException:
+                server.close()
+    
+    def build_pdf_email(self, sender_email: str, subject: str = None, message: str = None) -> 'MIMEMultipart':
+        """PDF 보고서를 첨부한 이메일 메시지 생성 (수신자는 호출자가 지정)
         
         Args:
-            recipient_email: 수신자 이메일
+            sender_email: 발신자 이메일
             subject: 이메일 제목 (기본값: 'A/B 테스트 결과 보고서')
             message: 이메일 본문 (기본값: 간단한 소개 메시지)
-            smtp_server: SMTP 서버 주소
-            smtp_port: SMTP 포트
-            sender_email: 발신자 이메일
-            sender_password: 발신자 이메일 비밀번호
             
         Returns:
-            bool: 이메일 전송 성공 여부
+            MIMEMultipart: 'To' 헤더가 없는 이메일 메시지
         """
-        if None in [smtp_server, sender_email, sender_password]:
-            raise ValueError("SMTP 서버, 발신자 이메일, 비밀번호가 모두 필요합니다.")
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
+        from email.mime.application import MIMEApplication
         
         # 기본값 설정
         if subject is None:
@@ -391,46 +552,133 @@ class Reporter:
             감사합니다.
             '''
         
-        # PDF 보고서 생성
-        pdf_filepath = self.generate_pdf_report()
+        # PDF 보고서 생성 (이미 생성된 PDF가 있으면 재사용)
+        pdf_bytes, pdf_filename = self._get_pdf_bytes()
         
         # 이메일 메시지 구성
         msg = MIMEMultipart()
         msg['From'] = sender_email
-        msg['To'] = recipient_email
         msg['Subject'] = subject
         
         # 텍스트 메시지 추가
         msg.attach(MIMEText(message, 'plain'))
         
         # PDF 첨부
-        with open(pdf_filepath, 'rb') as f:
-            pdf_attachment = MIMEApplication(f.read(), _subtype='pdf')
-            pdf_attachment.add_header('Content-Disposition', 'attachment', 
-                                     filename=os.path.basename(pdf_filepath))
-            msg.attach(pdf_attachment)
+        pdf_attachment = MIMEApplication(pdf_bytes, _subtype='pdf')
+        pdf_attachment.add_header('Content-Disposition', 'attachment', 
+                                 filename=pdf_filename)
+        msg.attach(pdf_attachment)
+        
+        return msg
+    
+    def send_pdf_to_many(self, recipients: List[str], subject: str = None, message: str = None,
+                         smtp_server: str = None, smtp_port: int = 587,
+                         sender_email: str = None, sender_password: str = None,
+                         server: Optional['smtplib.SMTP'] = None) -> Dict[str, bool]:
+        """PDF 보고서를 여러 수신자에게 전송
+        
+        메시지는 한 번만 구성하고 수신자마다 'To' 헤더만 바꿔서 하나의 SMTP 연결로 전송합니다.
+        
+        Args:
+            recipients: 수신자 이메일 목록
+            (나머지 인자는 send_email_with_pdf와 동일)
+            
+        Returns:
+            Dict[str, bool]: 수신자별 전송 성공 여부
+        """
+        if server is None and None in [smtp_server, sender_email, sender_password]:
+            raise ValueError("SMTP 서버, 발신자 이메일, 비밀번호가 모두 필요합니다.")
+        if sender_email is None:
+            sender_email = server.user
+        
+        msg = self.build_pdf_email(sender_email, subject, message)
+        results = {recipient: False for recipient in recipients}
+        
+        def send_all(server):
+            for recipient in recipients:
+                del msg['To']
+                msg['To'] = recipient
+                try:
+                    server.send_message(msg)
+                    results[recipient] = True
+                except Exception as e:
+                    print(f"이메일 전송 실패 ({recipient}): {str(e)}")
         
         try:
-            # SMTP 서버 연결 및 로그인
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            server.starttls()
-            server.login(sender_email, sender_password)
+            if server is not None:
+                send_all(server)
+            else:
+                with self.smtp_session(smtp_server, smtp_port, sender_email, sender_password) as server:
+                    send_all(server)
+        except Exception as e:
+            print(f"이메일 전송 실패: {str(e)}")
+        
+        return results
+    
+    def send_email_with_pdf(self, recipient_email: str, subject: str = None, message: str = None,
+                         smtp_server: str = None, smtp_port: int = 587,
+                         sender_email: str = None, sender_password: str = None,
+                         server: Optional['smtplib.SMTP'] = None) -> bool:
+        """PDF 보고서를 이메일로 전송
+        
+        Args:
+            recipient_email: 수신자 이메일
+            subject: 이메일 제목 (기본값: 'A/B 테스트 결과 보고서')
+            message: 이메일 본문 (기본값: 간단한 소개 메시지)
+            smtp_server: SMTP 서버 주소
+            smtp_port: SMTP 포트
+            sender_email: 발신자 이메일
+            sender_password: 발신자 이메일 비밀번호
+            server: smtp_session()으로 연결된 SMTP 서버 (지정하면 연결/로그인 생략)
+            
+        Returns:
+            bool: 이메일 전송 성공 여부
+        """
+        if server is None and None in [smtp_server, sender_email, sender_password]:
+            raise ValueError("SMTP 서버, 발신자 이메일, 비밀번호가 모두 필요합니다.")
+        if sender_email is None:
+            sender_email = server.user
+        
+        # 이메일 메시지 구성 (PDF 첨부 포함)
+        msg = self.build_pdf_email(sender_email, subject, message)
+        msg['To'] = recipient_email
+        
+        try:
+            # 이미 연결된 세션이 있으면 그대로 전송
+            if server is not None:
+                server.send_message(msg)
+                return True
             
-            # 이메일 전송
-            server.send_message(msg)
-            server.quit()
+            # SMTP 서버 연결 및 로그인 후 전송
+            with self.smtp_session(smtp_server, smtp_port, sender_email, sender_password) as server:
+                server.send_message(msg)
             
-            # 임시 파일 삭제
-            try:
-                os.remove(pdf_filepath)
-            except:
-                pass
-                
             return True
         except Exception as e:
             print(f"이메일 전송 실패: {str(e)}")
             return False
             
+    @classmethod
+    def _get_io_pool(cls) -> ThreadPoolExecutor:
+        """이메일 전송용 스레드 풀 반환"""
+        if cls._io_pool is None:
+            cls._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="reporter-io")
+        return cls._io_pool
+    
+    def send_email_with_pdf_async(self, *args, **kwargs) -> Future:
+        """send_email_with_pdf를 백그라운드 스레드에서 실행
+        
+        인자는 send_email_with_pdf와 동일하며, 결과(bool)는 반환된 Future로 확인합니다.
+        """
+        return self._get_io_pool().submit(self.send_email_with_pdf, *args, **kwargs)
+    
+    def send_email_async(self, *args, **kwargs) -> Future:
+        """send_email을 백그라운드 스레드에서 실행
+        
+        인자는 send_email과 동일하며, 결과(bool)는 반환된 Future로 확인합니다.
+        """
+        return self._get_io_pool().submit(self.send_email, *args, **kwargs)
+    
     # 기존 메서드 (하위 호환성 유지)
     def generate_report(self) -> str:
         """기존 HTML 형식의 A/B 테스트 결과 보고서 생성 (하위 호환성 유지)"""
@@ -442,9 +690,11 @@ class Reporter:
             self.generate_simple_html_report()
         
         if filepath is None:
-            # 임시 파일 생성
-            with tempfile.NamedTemporaryFile(suffix='.html', delete=False) as f:
-                filepath = f.name
+            # 임시 파일을 한 번만 열어서 바로 기록
+            fd, filepath = tempfile.mkstemp(suffix='.html')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.report_html)
+            return filepath
         
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(self.report_html)
@@ -456,16 +706,18 @@ class Reporter:
         if self.report_html is None:
             self.generate_simple_html_report()
         
-        # HTML을 base64로 인코딩
-        b64 = base64.b64encode(self.report_html.encode()).decode()
-        
-        # 다운로드 링크 생성
-        download_link = f'<a href="data:text/html;base64,{b64}" download="ab_test_report.html">보고서 다운로드</a>'
-        return download_link
+        if self._download_link_cache is None:
+            # HTML을 base64로 인코딩
+            b64 = base64.b64encode(self.report_html.encode('utf-8')).decode('ascii')
+            
+            # 다운로드 링크 생성
+            self._download_link_cache = f'<a href="data:text/html;base64,{b64}" download="ab_test_report.html">보고서 다운로드</a>'
+        return self._download_link_cache
     
     def send_email(self, recipient_email: str, subject: str = None, message: str = None,
                   smtp_server: str = None, smtp_port: int = 587,
-                  sender_email: str = None, sender_password: str = None) -> bool:
+                  sender_email: str = None, sender_password: str = None,
+                  server: Optional['smtplib.SMTP'] = None) -> bool:
         """결과 보고서를 이메일로 전송 (하위 호환성 유지)
         
         Args:
@@ -476,12 +728,15 @@ class Reporter:
             smtp_port: SMTP 포트
             sender_email: 발신자 이메일
             sender_password: 발신자 이메일 비밀번호
+            server: smtp_session()으로 연결된 SMTP 서버 (지정하면 연결/로그인 생략)
             
         Returns:
             bool: 이메일 전송 성공 여부
         """
-        if None in [smtp_server, sender_email, sender_password]:
+        if server is None and None in [smtp_server, sender_email, sender_password]:
             raise ValueError("SMTP 서버, 발신자 이메일, 비밀번호가 모두 필요합니다.")
+        if sender_email is None:
+            sender_email = server.user
         
         if self.report_html is None:
             self.generate_simple_html_report()
@@ -499,6 +754,9 @@ class Reporter:
             감사합니다.
             '''
         
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
+        
         # 이메일 메시지 구성
         msg = MIMEMultipart()
         msg['From'] = sender_email
@@ -514,14 +772,14 @@ class Reporter:
         msg.attach(html_attachment)
         
         try:
-            # SMTP 서버 연결 및 로그인
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            server.starttls()
-            server.login(sender_email, sender_password)
+            # 이미 연결된 세션이 있으면 그대로 전송
+            if server is not None:
+                server.send_message(msg)
+                return True
             
-            # 이메일 전송
-            server.send_message(msg)
-            server.quit()
+            # SMTP 서버 연결 및 로그인 후 전송
+            with self.smtp_session(smtp_server, smtp_port, sender_email, sender_password) as server:
+                server.send_message(msg)
             
             return True
         except Exception as e:
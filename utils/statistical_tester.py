@@ -1,12 +1,18 @@
 import numpy as np
-import pandas as pd
 from scipy import stats
-from statsmodels.stats.multicomp import pairwise_tukeyhsd, MultiComparison
-import statsmodels.api as sm
-from statsmodels.formula.api import ols
-from typing import Dict, List, Tuple, Optional, Union, Any
-import warnings
+from scipy.special import ndtri
+from typing import Dict, List, Tuple, Optional, Union, Any, Iterator
+from bisect import bisect_right
 from enum import Enum
+from functools import lru_cache
+from itertools import combinations
+
+try:
+    import numba
+except ImportError:  # numba는 선택 의존성 (없으면 NumPy 경로 사용)
+    numba = None
+
+from ._swilk_numba import shapiro_sorted_rows
 
 
 class TestType(Enum):
@@ -15,15 +21,319 @@ class TestType(Enum):
     NON_PARAMETRIC = "non_parametric"
 
 
+# 부트스트랩 가중치 블록의 최대 원소 수 (float64 기준 약 32MB)
+_BOOTSTRAP_BLOCK_SIZE = 2 ** 22
+
+# Numba 부트스트랩 커널에서 한 스레드가 연속으로 처리하는 리샘플 수 (블록마다 독립된 난수 상태 사용)
+_KERNEL_BLOCK = 64
+
+# 고유값 수가 표본 크기의 이 비율 이하이면 (고유값, 빈도) 가중 표현으로 부트스트랩
+_REWEIGH_MAX_RATIO = 0.25
+
+# 효과 크기/상관계수 해석 기준: 값이 thresholds[i] 미만이면 labels[i], 마지막 기준 이상이면 labels[-1]
+_EFFECT_LABELS = ("매우 작음", "작음", "중간", "큼")
+_COHEN_D_THRESHOLDS = (0.2, 0.5, 0.8)
+_ETA_SQUARED_THRESHOLDS = (0.01, 0.06, 0.14)
+_CORRELATION_THRESHOLDS = (0.1, 0.3, 0.5, 0.7)
+_CORRELATION_LABELS = ("매우 약한 상관관계", "약한 상관관계", "중간 정도의 상관관계", "강한 상관관계", "매우 강한 상관관계")
+
+
+if numba is not None:
+    @numba.njit(cache=True, inline='always')
+    def _splitmix64_next(state):
+        """SplitMix64 난수 생성기 한 단계: (다음 상태, 64비트 난수) 반환"""
+        state = state + np.uint64(0x9E3779B97F4A7C15)
+        z = state
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return state, z ^ (z >> np.uint64(31))
+    
+    @numba.njit(cache=True, inline='always')
+    def _block_rng_state(seed, block):
+        """(시드, 블록 번호)를 섞어 블록별로 겹치지 않는 난수 시작 상태 생성"""
+        _, state = _splitmix64_next(np.uint64(seed) * np.uint64(2 ** 32) + np.uint64(block))
+        return state
+    
+    @numba.njit(cache=True, inline='always')
+    def _random_index(z, n):
+        """64비트 난수의 상위 32비트를 [0, n) 범위 인덱스로 변환 (곱셈-시프트, 나눗셈 없음)"""
+        return ((z >> np.uint64(32)) * np.uint64(n)) >> np.uint64(32)
+    
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _bootstrap_means_kernel(data, n_resamples, seed):
+        """부트스트랩 리샘플 평균 계산 커널 (Numba JIT, 리샘플 블록 단위 병렬 처리)
+        
+        블록마다 (시드, 블록 번호)로 정해지는 자체 난수 상태를 레지스터에 두고 쓰므로
+        스레드 수나 스케줄링과 관계없이 같은 결과가 나오고, 중간 배열도 만들지 않습니다.
+        """
+        n = data.size
+        out = np.empty(n_resamples)
+        n_blocks = (n_resamples + _KERNEL_BLOCK - 1) // _KERNEL_BLOCK
+        for b in numba.prange(n_blocks):
+            state = _block_rng_state(seed, b)
+            for i in range(b * _KERNEL_BLOCK, min((b + 1) * _KERNEL_BLOCK, n_resamples)):
+                total = 0.0
+                for _ in range(n):
+                    state, z = _splitmix64_next(state)
+                    total += data[_random_index(z, n)]
+                out[i] = total / n
+        return out
+    
+    @numba.njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _bootstrap_welch_t_kernel(x, y, n_resamples, seed):
+        """두 표본을 각각 복원추출한 리샘플의 Welch t 통계량 계산 커널 (Numba JIT, 리샘플 블록 단위 병렬 처리)"""
+        nx = x.size
+        ny = y.size
+        out = np.empty(n_resamples)
+        n_blocks = (n_resamples + _KERNEL_BLOCK - 1) // _KERNEL_BLOCK
+        for b in numba.prange(n_blocks):
+            state = _block_rng_state(seed, b)
+            for i in range(b * _KERNEL_BLOCK, min((b + 1) * _KERNEL_BLOCK, n_resamples)):
+                sum_x = 0.0
+                sumsq_x = 0.0
+                for _ in range(nx):
+                    state, z = _splitmix64_next(state)
+                    value = x[_random_index(z, nx)]
+                    sum_x += value
+                    sumsq_x += value * value
+                sum_y = 0.0
+                sumsq_y = 0.0
+                for _ in range(ny):
+                    state, z = _splitmix64_next(state)
+                    value = y[_random_index(z, ny)]
+                    sum_y += value
+                    sumsq_y += value * value
+                mean_x = sum_x / nx
+                mean_y = sum_y / ny
+                var_x = (sumsq_x - nx * mean_x * mean_x) / (nx - 1)
+                var_y = (sumsq_y - ny * mean_y * mean_y) / (ny - 1)
+                out[i] = (mean_x - mean_y) / np.sqrt(var_x / nx + var_y / ny)
+        return out
+
+
+def _iter_bootstrap_indices(n: int, n_resamples: int, rng: np.random.Generator) -> Iterator[np.ndarray]:
+    """리샘플별 복원추출 인덱스 행렬 (리샘플 수 × n)을 메모리 한도 내 블록 단위로 생성"""
+    block = max(1, _BOOTSTRAP_BLOCK_SIZE // n)
+    for start in range(0, n_resamples, block):
+        size = min(block, n_resamples - start)
+        yield rng.integers(0, n, size=(size, n))
+
+
+def _iter_bootstrap_counts(n: int, n_resamples: int, rng: np.random.Generator) -> Iterator[np.ndarray]:
+    """리샘플별 관측치 추출 횟수 행렬(다항분포 가중치)을 메모리 한도 내 블록 단위로 생성"""
+    for idx in _iter_bootstrap_indices(n, n_resamples, rng):
+        size = idx.shape[0]
+        # 행마다 추출한 인덱스를 bincount 한 번으로 (size, n) 추출 횟수 행렬로 변환
+        # (Multinomial(n, 1/n)과 같은 분포이며 Generator.multinomial보다 빠름)
+        idx += (np.arange(size) * n)[:, None]
+        yield np.bincount(idx.ravel(), minlength=size * n).reshape(size, n).astype(np.float64)
+
+
+def _bootstrap_means(data, n_resamples: int, rng: np.random.Generator, binary: bool = False,
+                     value_counts: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> np.ndarray:
+    """복원추출 리샘플의 평균 분포 계산 (numba가 있으면 JIT 커널 사용)
+    
+    Args:
+        data: 표본 데이터
+        n_resamples: 리샘플링 수
+        rng: 난수 생성기 (Numba 커널은 여기서 뽑은 시드로 자체 난수 상태를 만듦)
+        binary: 데이터가 0/1 값만 가지는지 여부. True면 리샘플의 1의 개수가
+            Binomial(n, 표본 비율)을 따르므로 리샘플 없이 한 번의 난수 생성으로 계산
+        value_counts: 데이터의 (고유값, 빈도) 표현. 고유값이 충분히 적으면 리샘플별 고유값 추출 횟수를
+            Multinomial(n, 빈도/n)로 한 번에 생성해 (리샘플 수 × 고유값 수) 크기로만 계산
+    """
+    data = np.ascontiguousarray(data, dtype=np.float64)
+    n = data.size
+    
+    if binary:
+        return rng.binomial(n, data.mean(), size=n_resamples) / n
+    
+    if value_counts is not None and value_counts[0].size <= n * _REWEIGH_MAX_RATIO:
+        values, counts = value_counts
+        return rng.multinomial(n, counts / n, size=n_resamples) @ values / n
+    
+    if numba is not None:
+        # 생성기에서 시드를 뽑으므로 같은 시드의 생성기면 같은 결과
+        return _bootstrap_means_kernel(data, n_resamples, rng.integers(2**31 - 1))
+    
+    # (리샘플 수 × n) 인덱스 행렬로 한 번에 추출하고 행 평균 계산 (리샘플마다 도는 파이썬 루프 없음)
+    return np.concatenate([data[idx].mean(axis=1) for idx in _iter_bootstrap_indices(n, n_resamples, rng)])
+
+
+def _bootstrap_mean_var(data: np.ndarray, n_resamples: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """복원추출 리샘플의 평균과 표본분산(ddof=1) 분포 계산
+    
+    블록 단위로 추출한 리샘플에서 1·2차 합만 남기고 버리므로 전체 리샘플 행렬을 보관하지 않습니다.
+    분산 계산의 자릿수 손실을 줄이기 위해 표본 평균으로 중심화한 값에서 합을 구합니다.
+    """
+    n = data.size
+    center = data.mean()
+    centered = data - center
+    sums = []
+    sumsqs = []
+    for idx in _iter_bootstrap_indices(n, n_resamples, rng):
+        sample = centered[idx]
+        sums.append(sample.sum(axis=1))
+        sumsqs.append(np.einsum('ij,ij->i', sample, sample))
+    means = np.concatenate(sums) / n
+    variances = (np.concatenate(sumsqs) / n - means ** 2) * n / (n - 1)
+    return means + center, variances
+
+
+def _bootstrap_welch_t(x, y, n_resamples: int, rng: np.random.Generator) -> np.ndarray:
+    """두 표본을 각각 복원추출한 리샘플의 Welch t 통계량 분포 계산 (numba가 있으면 JIT 커널 사용)"""
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    
+    if numba is not None:
+        return _bootstrap_welch_t_kernel(x, y, n_resamples, rng.integers(2**31 - 1))
+    
+    mean_x, var_x = _bootstrap_mean_var(x, n_resamples, rng)
+    mean_y, var_y = _bootstrap_mean_var(y, n_resamples, rng)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (mean_x - mean_y) / np.sqrt(var_x / x.size + var_y / y.size)
+
+
+def _bootstrap_pearson(x, y, n_resamples: int, rng: np.random.Generator) -> np.ndarray:
+    """(x, y) 쌍을 복원추출한 리샘플의 피어슨 상관계수 분포 계산
+    
+    리샘플마다 추출 횟수 가중치로 1·2차 적률을 행렬곱으로 구해 상관계수를 한 번에 계산합니다.
+    """
+    # 상관계수는 평행이동에 불변이므로 중심화해 분산 계산 시 자릿수 손실을 줄임
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    x = x - x.mean()
+    y = y - y.mean()
+    n = x.size
+    
+    # 열: x, y, xy, x², y² → 가중치 행렬과 한 번의 행렬곱으로 다섯 개의 적률을 함께 계산
+    columns = np.column_stack([x, y, x * y, x * x, y * y])
+    moments = np.concatenate([counts @ columns for counts in _iter_bootstrap_counts(n, n_resamples, rng)]) / n
+    sx, sy, sxy, sxx, syy = moments.T
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (sxy - sx * sy) / np.sqrt((sxx - sx ** 2) * (syy - sy ** 2))
+
+
+@lru_cache(maxsize=32)
+def _ttest_ind_power(effect_size: float, nobs1: int, ratio: float, alpha: float) -> float:
+    """독립 2표본 t-검정의 검정력 (데이터와 유의수준에만 의존하므로 같은 입력이면 재사용)"""
+    from statsmodels.stats.power import TTestIndPower
+    return TTestIndPower().power(effect_size, nobs1=nobs1, ratio=ratio, alpha=alpha)
+
+
+@lru_cache(maxsize=32)
+def _anova_power(effect_size: float, nobs: int, alpha: float, k_groups: int) -> float:
+    """일원배치 ANOVA의 검정력 (effect_size는 Cohen's f, nobs는 전체 표본 수)"""
+    from statsmodels.stats.power import FTestAnovaPower
+    return FTestAnovaPower().power(effect_size, nobs=nobs, alpha=alpha, k_groups=k_groups)
+
+
+def _kruskal_dunn(values: np.ndarray, codes: np.ndarray, k: int) -> Tuple[float, float, np.ndarray, np.ndarray]:
+    """전체 데이터를 한 번만 순위화해 Kruskal-Wallis 검정과 Dunn 사후 검정을 함께 계산
+    
+    Args:
+        values: 그룹 순서대로 이어 붙인 값 배열
+        codes: 각 값의 그룹 코드 (0 ~ k-1)
+        k: 그룹 수
+    
+    Returns:
+        (H 통계량, p-value, 쌍별 z 통계량 행렬, 쌍별 보정 전 p-value 행렬)
+        z[i, j]는 그룹 i와 j의 평균 순위 차이를 표준화한 값입니다.
+    """
+    n_total = values.size
+    ranks = stats.rankdata(values)
+    counts = np.bincount(codes, minlength=k)
+    mean_ranks = np.bincount(codes, weights=ranks, minlength=k) / counts
+    
+    # 동순위 보정항 sum(t^3 - t)
+    _, tie_counts = np.unique(values, return_counts=True)
+    tie_sum = float(np.sum(tie_counts ** 3 - tie_counts, dtype=np.float64))
+    
+    # Kruskal-Wallis H (scipy.stats.kruskal과 동일한 식)
+    h = 12.0 / (n_total * (n_total + 1)) * np.sum(counts * mean_ranks ** 2) - 3.0 * (n_total + 1)
+    h /= 1.0 - tie_sum / (n_total ** 3 - n_total)
+    p_value = stats.chi2.sf(h, k - 1)
+    
+    # Dunn z 통계량: 평균 순위 차이 / 표준오차
+    variance = n_total * (n_total + 1) / 12.0 - tie_sum / (12.0 * (n_total - 1))
+    inv_counts = 1.0 / counts
+    z = (mean_ranks[:, None] - mean_ranks[None, :]) / np.sqrt(variance * (inv_counts[:, None] + inv_counts[None, :]))
+    pairwise_p = 2.0 * stats.norm.sf(np.abs(z))
+    return float(h), float(p_value), z, pairwise_p
+
+
+def _one_way_anova_from_moments(counts: np.ndarray, means: np.ndarray,
+                                variances: np.ndarray) -> Tuple[float, float, float, float]:
+    """그룹별 표본 수/평균/표본분산만으로 일원배치 ANOVA 계산 (scipy.stats.f_oneway와 동일한 식)
+    
+    Returns:
+        (F 통계량, p-value, 그룹 간 제곱합 SS_between, 그룹 내 제곱합 SS_within)
+    """
+    k = len(counts)
+    n_total = counts.sum()
+    grand_mean = np.sum(counts * means) / n_total
+    
+    ss_between = float(np.sum(counts * (means - grand_mean) ** 2))
+    # 표본이 1개인 그룹은 분산이 NaN이지만 그룹 내 제곱합 기여는 0
+    ss_within = float(np.sum(np.where(counts > 1, (counts - 1) * variances, 0.0)))
+    df_between = k - 1
+    df_within = n_total - k
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f_statistic = (ss_between / df_between) / (ss_within / df_within)
+    return float(f_statistic), float(stats.f.sf(f_statistic, df_between, df_within)), ss_between, ss_within
+
+
+def _bartlett_from_moments(counts: np.ndarray, variances: np.ndarray) -> Tuple[float, float]:
+    """그룹별 표본 수와 표본분산만으로 Bartlett 검정 통계량과 p-value 계산 (scipy.stats.bartlett과 동일한 식)"""
+    k = len(counts)
+    dof = counts - 1.0
+    total_dof = dof.sum()
+    
+    pooled_var = np.sum(dof * variances) / total_dof
+    numer = total_dof * np.log(pooled_var) - np.sum(dof * np.log(variances))
+    denom = 1.0 + (np.sum(1.0 / dof) - 1.0 / total_dof) / (3.0 * (k - 1))
+    statistic = numer / denom
+    
+    return statistic, stats.chi2.sf(statistic, k - 1)
+
+
+def _levene_median(arrays: List[np.ndarray], stacked: np.ndarray) -> Tuple[float, float]:
+    """중앙값 기준 Levene 검정 (Brown-Forsythe, scipy.stats.levene(center='median')과 동일한 값)
+    
+    그룹 순서대로 이어진 값 배열에서 그룹 중앙값과의 절대편차를 한 번에 구하고, 그룹별 편차의
+    평균/분산을 구간 합(reduceat)으로 계산해 일원배치 ANOVA 식에 대입합니다.
+    
+    Args:
+        arrays: 그룹별 값 배열
+        stacked: arrays를 순서대로 이어 붙인 배열 (DataProcessor.get_stacked_data()의 값 배열)
+    """
+    counts = np.array([a.size for a in arrays])
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    medians = np.array([np.median(a) for a in arrays])
+    
+    deviations = np.abs(stacked - np.repeat(medians, counts))
+    dev_means = np.add.reduceat(deviations, starts) / counts
+    centered = deviations - np.repeat(dev_means, counts)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dev_vars = np.add.reduceat(centered * centered, starts) / (counts - 1)
+    
+    statistic, p_value, _, _ = _one_way_anova_from_moments(counts.astype(np.float64), dev_means, dev_vars)
+    return statistic, p_value
+
+
 class StatisticalTester:
     """통계 검정을 수행하는 클래스"""
     
-    def __init__(self, data_processor):
+    def __init__(self, data_processor, seed: Optional[int] = None):
         """
         Args:
             data_processor: DataProcessor 클래스의 인스턴스
+            seed: 부트스트랩 난수 시드 (지정하면 같은 입력에 대해 같은 결과)
         """
         self.data_processor = data_processor
+        self.rng = np.random.default_rng(seed)
         self.normality_results = {}
         self.homogeneity_results = {}
         self.hypothesis_test_results = {}
@@ -40,44 +350,70 @@ class StatisticalTester:
         else:
             raise ValueError("유의수준은 0과 1 사이의 값이어야 합니다.")
     
+    def _one_way_anova(self) -> Tuple[float, float, float, float]:
+        """일원배치 ANOVA (F 통계량, p-value, SS_between, SS_within)
+        
+        미리 계산된 그룹별 표본 수/평균/분산만 사용하므로 O(그룹 수)이며, 가설 검정의 F 검정과
+        Eta-squared 계산이 같은 제곱합을 사용합니다.
+        """
+        moments = self.data_processor.get_group_moments()
+        return _one_way_anova_from_moments(
+            moments["count"].to_numpy(dtype=np.float64),
+            moments["mean"].to_numpy(),
+            moments["var"].to_numpy()
+        )
+    
     def test_normality(self) -> Dict[str, Dict[str, Any]]:
         """각 그룹의 정규성 검정 (Shapiro-Wilk, QQ Plot 데이터)"""
         if not self.data_processor.groups:
             raise ValueError("그룹 데이터가 설정되지 않았습니다. 그룹 열과 타겟 열을 먼저 설정해 주세요.")
         
-        self.normality_results = {}
+        group_arrays = self.data_processor.get_group_arrays()
         
-        # 각 그룹별로 정규성 검정
-        for group in self.data_processor.groups:
-            group_data = self.data_processor.get_group_data(group)
-            
+        # 그룹 순서를 유지하기 위해 먼저 키를 만들어 두고, 길이가 같은 그룹끼리 묶어 한 번에 검정
+        self.normality_results = dict.fromkeys(self.data_processor.groups)
+        length_buckets = {}
+        for group, group_data in group_arrays.items():
             # 샘플 크기가 3보다 작으면 정규성 검정을 수행할 수 없음
             if len(group_data) < 3:
                 self.normality_results[group] = {
                     "shapiro": {"statistic": None, "p_value": None, "normal": None},
                     "qq_plot": {"theoretical_quantiles": None, "sample_quantiles": None}
                 }
-                continue
+            else:
+                length_buckets.setdefault(len(group_data), []).append(group)
+        
+        for n, groups in length_buckets.items():
+            # 정렬은 한 번만 수행해 Shapiro-Wilk 검정과 QQ Plot에서 함께 사용
+            # (이미 정렬된 배열은 shapiro 내부 정렬 비용이 거의 없음)
+            sorted_rows = np.sort(np.vstack([group_arrays[group] for group in groups]), axis=1)
             
-            # Shapiro-Wilk 검정
-            shapiro_test = stats.shapiro(group_data)
-            is_normal = shapiro_test.pvalue > self.alpha
+            # Shapiro-Wilk 검정 (같은 길이 그룹들을 행 단위로 한 번에 계산)
+            # numba가 있으면 JIT 커널을 쓰고, 범위가 0인 표본 등 커널이 처리하지 않는 경우는 SciPy 사용
+            swilk = shapiro_sorted_rows(sorted_rows)
+            if swilk is not None and not np.isnan(swilk[0]).any():
+                statistics, p_values = swilk
+            else:
+                shapiro_test = stats.shapiro(sorted_rows, axis=1)
+                statistics = np.atleast_1d(shapiro_test.statistic)
+                p_values = np.atleast_1d(shapiro_test.pvalue)
             
-            # QQ Plot 데이터 생성
-            sample_quantiles = np.sort(group_data)
-            theoretical_quantiles = stats.norm.ppf(np.linspace(0.01, 0.99, len(sample_quantiles)))
+            # QQ Plot 이론 분위수는 표본 크기에만 의존하므로 버킷마다 한 번만 계산
+            # (표준정규 분위수이므로 분포 객체의 인자 검사/변환 없이 ndtri를 바로 사용)
+            theoretical_quantiles = ndtri(np.linspace(0.01, 0.99, n))
             
-            self.normality_results[group] = {
-                "shapiro": {
-                    "statistic": shapiro_test.statistic,
-                    "p_value": shapiro_test.pvalue,
-                    "normal": is_normal
-                },
-                "qq_plot": {
-                    "theoretical_quantiles": theoretical_quantiles,
-                    "sample_quantiles": sample_quantiles
+            for row, group in enumerate(groups):
+                self.normality_results[group] = {
+                    "shapiro": {
+                        "statistic": statistics[row],
+                        "p_value": p_values[row],
+                        "normal": p_values[row] > self.alpha
+                    },
+                    "qq_plot": {
+                        "theoretical_quantiles": theoretical_quantiles,
+                        "sample_quantiles": sorted_rows[row]
+                    }
                 }
-            }
         
         return self.normality_results
     
@@ -86,27 +422,30 @@ class StatisticalTester:
         if not self.data_processor.groups:
             raise ValueError("그룹 데이터가 설정되지 않았습니다. 그룹 열과 타겟 열을 먼저 설정해 주세요.")
         
-        # 각 그룹의 데이터 수집
-        group_data = []
-        for group in self.data_processor.groups:
-            group_data.append(self.data_processor.get_group_data(group))
+        moments = self.data_processor.get_group_moments()
         
-        # Bartlett 검정 - 정규성 가정이 충족될 때 사용
-        bartlett_test = stats.bartlett(*group_data)
+        # Bartlett 검정 - 정규성 가정이 충족될 때 사용 (미리 계산된 표본 수와 분산으로 계산)
+        bartlett_statistic, bartlett_p_value = _bartlett_from_moments(
+            moments["count"].to_numpy(dtype=np.float64),
+            moments["var"].to_numpy(dtype=np.float64)
+        )
         
         # Levene 검정 - 정규성 가정이 충족되지 않아도 사용 가능
-        levene_test = stats.levene(*group_data, center='median')
+        levene_statistic, levene_p_value = _levene_median(
+            list(self.data_processor.get_group_arrays().values()),
+            self.data_processor.get_stacked_data()[0]
+        )
         
         self.homogeneity_results = {
             "bartlett": {
-                "statistic": bartlett_test.statistic,
-                "p_value": bartlett_test.pvalue,
-                "equal_variances": bartlett_test.pvalue > self.alpha
+                "statistic": bartlett_statistic,
+                "p_value": bartlett_p_value,
+                "equal_variances": bartlett_p_value > self.alpha
             },
             "levene": {
-                "statistic": levene_test.statistic,
-                "p_value": levene_test.pvalue,
-                "equal_variances": levene_test.pvalue > self.alpha
+                "statistic": levene_statistic,
+                "p_value": levene_p_value,
+                "equal_variances": levene_p_value > self.alpha
             }
         }
         
@@ -142,14 +481,7 @@ class StatisticalTester:
             self.determine_test_type()
             
         num_groups = len(self.data_processor.groups)
-        group_data = self.data_processor.get_group_data()
-        
-        # 데이터 준비
-        all_data = []
-        all_groups = []
-        for group, data in group_data.items():
-            all_data.extend(data.tolist())
-            all_groups.extend([group] * len(data))
+        group_data = self.data_processor.get_group_arrays()
         
         # 2개 그룹 비교
         if num_groups == 2:
@@ -187,65 +519,64 @@ class StatisticalTester:
         # 3개 이상 그룹 비교
         else:
             if self.test_type == TestType.PARAMETRIC:
-                # 분산분석(ANOVA)
-                df = pd.DataFrame({
-                    'value': all_data,
-                    'group': all_groups
-                })
-                
-                # ANOVA 모델 피팅
-                model = ols('value ~ C(group)', data=df).fit()
-                anova_table = sm.stats.anova_lm(model, typ=2)
+                # 분산분석(ANOVA): 그룹별 표본 수/평균/분산에서 바로 계산 (formula/데이터프레임 구성 없음)
+                f_statistic, anova_p_value, _, _ = self._one_way_anova()
+                arrays = [group_data[group] for group in self.data_processor.groups]
                 
                 # 사후 검정 (Tukey HSD)
-                tukey = pairwise_tukeyhsd(endog=df['value'], groups=df['group'], alpha=self.alpha)
-                tukey_result = pd.DataFrame(data=tukey._results_table.data[1:], 
-                                           columns=tukey._results_table.data[0])
+                # statistic[i, j] = mean_i - mean_j 이므로 statsmodels와 같은 (group2 - group1) 부호는 [j, i] 원소
+                tukey = stats.tukey_hsd(*arrays)
+                ci = tukey.confidence_interval(confidence_level=1 - self.alpha)
+                tukey_result = []
+                for i, j in zip(*np.triu_indices(num_groups, k=1)):
+                    p_adj = tukey.pvalue[i, j]
+                    tukey_result.append({
+                        "group1": self.data_processor.groups[i],
+                        "group2": self.data_processor.groups[j],
+                        "meandiff": round(float(tukey.statistic[j, i]), 4),
+                        "p-adj": round(float(p_adj), 4),
+                        "lower": round(float(ci.low[j, i]), 4),
+                        "upper": round(float(ci.high[j, i]), 4),
+                        "reject": bool(p_adj < self.alpha)
+                    })
                 
                 self.hypothesis_test_results = {
                     "test_name": "일원배치 분산분석(ANOVA)",
-                    "f_statistic": anova_table.loc['C(group)', 'F'],
-                    "p_value": anova_table.loc['C(group)', 'PR(>F)'],
-                    "significant": anova_table.loc['C(group)', 'PR(>F)'] < self.alpha,
+                    "f_statistic": f_statistic,
+                    "p_value": anova_p_value,
+                    "significant": anova_p_value < self.alpha,
                     "post_hoc": {
                         "method": "Tukey HSD",
-                        "results": tukey_result.to_dict('records')
+                        "results": tukey_result
                     }
                 }
             else:
-                # 비모수 검정 (Kruskal-Wallis)
-                kruskal = stats.kruskal(*[data for data in group_data.values()])
+                # 비모수 검정 (Kruskal-Wallis) + 사후 검정 (Dunn's test)
+                # 전체 데이터를 한 번만 순위화해 두 검정에 함께 사용하고, Bonferroni 보정은 한 번에 적용
+                groups = self.data_processor.groups
+                all_data, all_codes = self.data_processor.get_stacked_data()
+                h_statistic, h_p_value, z, pairwise_p = _kruskal_dunn(all_data, all_codes, num_groups)
                 
-                # 사후 검정 (Dunn's test)
-                # SciPy에는 없어서 직접 구현하거나 statsmodels의 MultiComparison 사용
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore")
-                    df = pd.DataFrame({
-                        'value': all_data,
-                        'group': all_groups
-                    })
-                    
-                    # 사후 검정을 위한 pairwise 비교
-                    mc = MultiComparison(df['value'], df['group'])
-                    dunn_result = mc.allpairtest(stats.mannwhitneyu, method='bonf')
-                    
-                    # 결과 변환
-                    pairwise_results = []
-                    for i, row in enumerate(dunn_result[0].data):
-                        if i > 0:  # 헤더 행 제외
-                            pairwise_results.append({
-                                'group1': row[0],
-                                'group2': row[1],
-                                'statistic': row[2],
-                                'p_value': row[3],
-                                'significant': row[3] < self.alpha
-                            })
+                pairs = list(combinations(range(num_groups), 2))
+                rows, cols = np.array(pairs).T
+                p_values_adj = np.minimum(pairwise_p[rows, cols] * len(pairs), 1.0)
+                
+                pairwise_results = [
+                    {
+                        'group1': groups[i],
+                        'group2': groups[j],
+                        'statistic': float(z[i, j]),
+                        'p_value': float(p_adj),
+                        'significant': bool(p_adj < self.alpha)
+                    }
+                    for (i, j), p_adj in zip(pairs, p_values_adj)
+                ]
                 
                 self.hypothesis_test_results = {
                     "test_name": "Kruskal-Wallis 검정",
-                    "statistic": kruskal.statistic,
-                    "p_value": kruskal.pvalue,
-                    "significant": kruskal.pvalue < self.alpha,
+                    "statistic": h_statistic,
+                    "p_value": h_p_value,
+                    "significant": h_p_value < self.alpha,
                     "post_hoc": {
                         "method": "Dunn's test (Bonferroni 보정)",
                         "results": pairwise_results
@@ -261,18 +592,15 @@ class StatisticalTester:
         
         # 효과 크기 계산 결과 초기화
         self.effect_size_results = {}
-        group_data = self.data_processor.get_group_data()
         num_groups = len(self.data_processor.groups)
         
         # 두 그룹 비교: Cohen's d 계산
         if num_groups == 2:
-            group1_data = group_data[self.data_processor.groups[0]]
-            group2_data = group_data[self.data_processor.groups[1]]
-            
-            # Cohen's d 계산
-            mean1, mean2 = group1_data.mean(), group2_data.mean()
-            n1, n2 = len(group1_data), len(group2_data)
-            var1, var2 = group1_data.var(), group2_data.var()
+            # Cohen's d 계산 (미리 계산된 그룹별 표본 수/평균/분산 사용)
+            moments = self.data_processor.get_group_moments()
+            n1, n2 = moments["count"]
+            mean1, mean2 = moments["mean"]
+            var1, var2 = moments["var"]
             
             # Pooled standard deviation
             pooled_std = np.sqrt(((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2))
@@ -281,14 +609,7 @@ class StatisticalTester:
             cohen_d = (mean1 - mean2) / pooled_std
             
             # Cohen's d 해석
-            if abs(cohen_d) < 0.2:
-                effect_interpretation = "매우 작음"
-            elif abs(cohen_d) < 0.5:
-                effect_interpretation = "작음"
-            elif abs(cohen_d) < 0.8:
-                effect_interpretation = "중간"
-            else:
-                effect_interpretation = "큼"
+            effect_interpretation = _EFFECT_LABELS[bisect_right(_COHEN_D_THRESHOLDS, abs(cohen_d))]
                 
             self.effect_size_results = {
                 "measure": "Cohen's d",
@@ -299,33 +620,12 @@ class StatisticalTester:
         
         # 세 그룹 이상: Eta-squared 계산
         else:
-            # 전체 그룹 데이터 준비
-            all_data = []
-            all_groups = []
-            for group, data in group_data.items():
-                all_data.extend(data)
-                all_groups.extend([group] * len(data))
-            
-            df = pd.DataFrame({"value": all_data, "group": all_groups})
-            
-            # ANOVA 모델 피팅
-            model = ols('value ~ C(group)', data=df).fit()
-            anova_table = sm.stats.anova_lm(model, typ=2)
-            
-            # Eta-squared 계산
-            ss_group = anova_table.loc['C(group)', 'sum_sq']
-            ss_total = ss_group + anova_table.loc['Residual', 'sum_sq']
-            eta_squared = ss_group / ss_total
+            # Eta-squared 계산 (가설 검정의 ANOVA와 같은 제곱합 사용)
+            _, _, ss_group, ss_within = self._one_way_anova()
+            eta_squared = ss_group / (ss_group + ss_within)
             
             # Eta-squared 해석
-            if eta_squared < 0.01:
-                effect_interpretation = "매우 작음"
-            elif eta_squared < 0.06:
-                effect_interpretation = "작음"
-            elif eta_squared < 0.14:
-                effect_interpretation = "중간"
-            else:
-                effect_interpretation = "큼"
+            effect_interpretation = _EFFECT_LABELS[bisect_right(_ETA_SQUARED_THRESHOLDS, eta_squared)]
                 
             self.effect_size_results = {
                 "measure": "Eta-squared",
@@ -342,43 +642,54 @@ class StatisticalTester:
             raise ValueError("그룹 데이터가 설정되지 않았습니다. 그룹 열과 타겟 열을 먼저 설정해 주세요.")
         
         self.bootstrap_results = {}
-        group_data = self.data_processor.get_group_data()
+        group_data = self.data_processor.get_group_arrays()
         
         # 각 그룹별 부트스트랩 샘플링
+        group_bootstrap_means = {}
         for group in self.data_processor.groups:
             data = group_data[group]
-            bootstrap_means = []
             
             # 부트스트랩 리샘플링 수행
-            for _ in range(n_resamples):
-                resample = np.random.choice(data, size=len(data), replace=True)
-                bootstrap_means.append(np.mean(resample))
+            bootstrap_means = _bootstrap_means(
+                data,
+                n_resamples,
+                self.rng,
+                binary=self.data_processor.is_binary_target,
+                value_counts=self.data_processor.reweigh(group)
+            )
+            group_bootstrap_means[group] = bootstrap_means
             
             # 신뢰구간 계산 (95%)
-            ci_lower = np.percentile(bootstrap_means, 2.5)
-            ci_upper = np.percentile(bootstrap_means, 97.5)
+            ci_lower, ci_upper = np.percentile(bootstrap_means, [2.5, 97.5])
             
             self.bootstrap_results[group] = {
                 "mean": np.mean(data),
                 "bootstrap_mean": np.mean(bootstrap_means),
                 "ci_lower": ci_lower,
-                "ci_upper": ci_upper,
-                "bootstrap_samples": bootstrap_means
+                "ci_upper": ci_upper
             }
         
         # 두 그룹 간 차이에 대한 부트스트랩 (그룹이 2개일 경우)
         if len(self.data_processor.groups) == 2:
             group1, group2 = self.data_processor.groups
             data1, data2 = group_data[group1], group_data[group2]
-            diff_means = []
             
-            for _ in range(n_resamples):
-                resample1 = np.random.choice(data1, size=len(data1), replace=True)
-                resample2 = np.random.choice(data2, size=len(data2), replace=True)
-                diff_means.append(np.mean(resample1) - np.mean(resample2))
+            # 두 그룹은 독립적으로 리샘플링되므로 그룹별 부트스트랩 평균의 차이를 그대로 사용
+            diff_means = group_bootstrap_means[group1] - group_bootstrap_means[group2]
+            
+            ci_diff_lower, ci_diff_upper = np.percentile(diff_means, [2.5, 97.5])
             
-            ci_diff_lower = np.percentile(diff_means, 2.5)
-            ci_diff_upper = np.percentile(diff_means, 97.5)
+            # Efron 부트스트랩 평균 차이 검정: 두 표본을 합동 평균으로 이동시켜 귀무가설(평균 동일)을
+            # 만족시킨 뒤 리샘플링하고, 관측된 Welch t보다 극단적인 리샘플 비율을 p-value로 사용
+            t_observed = stats.ttest_ind(data1, data2, equal_var=False).statistic
+            pooled_mean = np.concatenate([data1, data2]).mean()
+            t_bootstrap = _bootstrap_welch_t(
+                data1 - data1.mean() + pooled_mean,
+                data2 - data2.mean() + pooled_mean,
+                n_resamples,
+                self.rng
+            )
+            bootstrap_p_value = np.mean(np.abs(t_bootstrap) >= np.abs(t_observed))
             
             self.bootstrap_results["difference"] = {
                 "groups": f"{group1} - {group2}",
@@ -386,6 +697,8 @@ class StatisticalTester:
                 "bootstrap_mean_diff": np.mean(diff_means),
                 "ci_lower": ci_diff_lower,
                 "ci_upper": ci_diff_upper,
+                "t_statistic": t_observed,
+                "p_value": bootstrap_p_value,
                 "significant": (ci_diff_lower > 0 and ci_diff_upper > 0) or (ci_diff_lower < 0 and ci_diff_upper < 0)
             }
         
@@ -396,7 +709,8 @@ class StatisticalTester:
         if not self.data_processor.groups:
             raise ValueError("그룹 데이터가 설정되지 않았습니다. 그룹 열과 타겟 열을 먼저 설정해 주세요.")
         
-        group_data = self.data_processor.get_group_data()
+        # 검정력 계산에는 그룹별 표본 수만 필요하므로 미리 계산된 값 사용
+        sample_sizes = self.data_processor.get_group_moments()["count"]
         num_groups = len(self.data_processor.groups)
         
         # 제1종 오류 (알파): 이미 설정된 alpha 값 사용
@@ -409,8 +723,7 @@ class StatisticalTester:
         # 검정력 및 제2종 오류 계산 (두 그룹 비교의 경우)
         if num_groups == 2:
             group1, group2 = self.data_processor.groups
-            data1, data2 = group_data[group1], group_data[group2]
-            n1, n2 = len(data1), len(data2)
+            n1, n2 = int(sample_sizes[group1]), int(sample_sizes[group2])
             
             # 효과 크기
             effect_size = abs(self.effect_size_results["value"])
@@ -418,15 +731,11 @@ class StatisticalTester:
             # 제2종 오류(베타) 계산을 위한 검정력 분석
             if self.test_type == TestType.PARAMETRIC:
                 # t-검정의 검정력
-                from statsmodels.stats.power import TTestIndPower
-                power_analysis = TTestIndPower()
-                power = power_analysis.power(effect_size, nobs1=n1, ratio=n2/n1, alpha=type_1_error)
+                power = _ttest_ind_power(effect_size, n1, n2 / n1, type_1_error)
             else:
                 # 비모수 검정의 경우 근사값 사용 (효율 ~0.95)
-                from statsmodels.stats.power import TTestIndPower
-                power_analysis = TTestIndPower()
                 # 비모수 검정은 모수적 방법보다 약간 검정력이 낮음 (효율 계수 적용)
-                power = power_analysis.power(effect_size * 0.95, nobs1=n1, ratio=n2/n1, alpha=type_1_error)
+                power = _ttest_ind_power(effect_size * 0.95, n1, n2 / n1, type_1_error)
             
             type_2_error = 1 - power
             
@@ -447,17 +756,14 @@ class StatisticalTester:
         else:
             # 3개 이상 그룹에 대한 검정력 분석은 복잡함
             # ANOVA의 검정력에 대한 근사값 제공
-            from statsmodels.stats.power import FTestAnovaPower
-            power_analysis = FTestAnovaPower()
-            
             # 효과 크기 (eta-squared에서 f로 변환)
             effect_size = np.sqrt(self.effect_size_results["value"] / (1 - self.effect_size_results["value"]))
             
             # 전체 샘플 수
-            total_n = sum(len(data) for data in group_data.values())
+            total_n = int(sample_sizes.sum())
             
-            # ANOVA 검정력 계산
-            power = power_analysis.power(effect_size, num_groups, total_n, alpha=type_1_error)
+            # ANOVA 검정력 계산 (nobs는 전체 표본 수, k_groups는 그룹 수)
+            power = _anova_power(float(effect_size), total_n, type_1_error, num_groups)
             type_2_error = 1 - power
             
             self.error_analysis = {
@@ -465,7 +771,7 @@ class StatisticalTester:
                 "type_2_error": type_2_error,
                 "power": power,
                 "effect_size": effect_size,
-                "sample_sizes": {group: len(data) for group, data in group_data.items()},
+                "sample_sizes": {group: int(n) for group, n in sample_sizes.items()},
                 "error_matrix": {
                     "reject_null_true_diff": 1 - type_2_error,  # 옳은 결정
                     "not_reject_null_true_diff": type_2_error,  # 제2종 오류
@@ -476,12 +782,16 @@ class StatisticalTester:
         
         return self.error_analysis
 
-    def pearson_correlation(self) -> Dict[str, Any]:
-        """그룹 간 피어슨 상관계수 계산"""
+    def pearson_correlation(self, n_resamples: int = 1000) -> Dict[str, Any]:
+        """그룹 간 피어슨 상관계수 계산 (부트스트랩 95% 신뢰구간 포함)
+        
+        Args:
+            n_resamples: 부트스트랩 리샘플링 수
+        """
         if not self.data_processor.groups or len(self.data_processor.groups) != 2:
             raise ValueError("피어슨 상관계수는 두 그룹 간에만 계산 가능합니다.")
         
-        group_data = self.data_processor.get_group_data()
+        group_data = self.data_processor.get_group_arrays()
         group1, group2 = self.data_processor.groups
         data1, data2 = group_data[group1], group_data[group2]
         
@@ -493,9 +803,15 @@ class StatisticalTester:
         # 피어슨 상관계수 계산
         pearson_r, p_value = stats.pearsonr(data1, data2)
         
+        # 부트스트랩 신뢰구간 (분산이 0인 리샘플은 제외)
+        bootstrap_r = _bootstrap_pearson(data1, data2, n_resamples, self.rng)
+        ci_lower, ci_upper = np.nanpercentile(bootstrap_r, [2.5, 97.5])
+        
         return {
             "pearson_r": pearson_r,
             "p_value": p_value,
+            "ci_lower": ci_lower,
+            "ci_upper": ci_upper,
             "significant": p_value < self.alpha,
             "interpretation": self._interpret_correlation(pearson_r)
         }
@@ -505,27 +821,23 @@ class StatisticalTester:
         if not self.data_processor.groups:
             raise ValueError("그룹 데이터가 설정되지 않았습니다.")
         
-        group_data = self.data_processor.get_group_data()
+        group_data = self.data_processor.get_group_arrays()
         
         # 데이터를 이진화하기 위한 임계값 설정
         if threshold is None:
             # 기본적으로 각 그룹의 중앙값 사용
-            thresholds = {group: data.median() for group, data in group_data.items()}
+            thresholds = {group: np.median(data) for group, data in group_data.items()}
         else:
             thresholds = {group: threshold for group in self.data_processor.groups}
         
-        # 이진화된 데이터 준비 (임계값 이상 = 1, 미만 = 0)
-        binary_data = {}
-        for group, data in group_data.items():
-            binary_data[group] = (data >= thresholds[group]).astype(int)
-        
         # 카이제곱 검정을 위한 분할표(contingency table) 생성
+        # 열: (임계값 미만 = 0, 임계값 이상 = 1)의 개수 (이진화 배열 없이 비교 결과를 바로 셈)
         contingency_table = np.zeros((len(self.data_processor.groups), 2))
         
         for i, group in enumerate(self.data_processor.groups):
-            # 각 범주(0, 1)의 개수 계산
-            counts = np.bincount(binary_data[group], minlength=2)
-            contingency_table[i] = counts
+            data = group_data[group]
+            above = np.count_nonzero(data >= thresholds[group])
+            contingency_table[i] = (data.size - above, above)
         
         # 카이제곱 검정 수행
         chi2, p_value, dof, expected = stats.chi2_contingency(contingency_table)
@@ -548,8 +860,12 @@ class StatisticalTester:
             "odds_ratio": odds_ratio
         }
     
-    def run_all_tests(self) -> Dict[str, Any]:
-        """모든 적절한 테스트를 실행하고 결과 종합"""
+    def run_all_tests(self, n_bootstrap: int = 1000) -> Dict[str, Any]:
+        """모든 적절한 테스트를 실행하고 결과 종합
+        
+        Args:
+            n_bootstrap: 부트스트랩 리샘플링 수
+        """
         # 정규성 및 등분산성 검정
         self.test_normality()
         self.test_homogeneity()
@@ -564,7 +880,7 @@ class StatisticalTester:
         self.calculate_effect_size()
         
         # 부트스트랩 분석
-        self.perform_bootstrap()
+        self.perform_bootstrap(n_bootstrap)
         
         # 오류 분석
         self.analyze_errors()
@@ -580,19 +896,19 @@ class StatisticalTester:
             "error_analysis": self.error_analysis
         }
     
+    def restore_results(self, results: Dict[str, Any]) -> None:
+        """run_all_tests()가 반환한 결과 스냅샷으로 상태 복원 (캐시된 결과 재사용용)"""
+        self.normality_results = results["normality"]
+        self.homogeneity_results = results["homogeneity"]
+        self.test_type = TestType(results["test_type"])
+        self.hypothesis_test_results = results["hypothesis_test"]
+        self.effect_size_results = results["effect_size"]
+        self.bootstrap_results = results["bootstrap"]
+        self.error_analysis = results["error_analysis"]
+    
     def _interpret_correlation(self, r: float) -> str:
         """상관계수 해석"""
-        abs_r = abs(r)
-        if abs_r < 0.1:
-            return "매우 약한 상관관계"
-        elif abs_r < 0.3:
-            return "약한 상관관계"
-        elif abs_r < 0.5:
-            return "중간 정도의 상관관계"
-        elif abs_r < 0.7:
-            return "강한 상관관계"
-        else:
-            return "매우 강한 상관관계"
+        return _CORRELATION_LABELS[bisect_right(_CORRELATION_THRESHOLDS, abs(r))]
     
     def get_null_alternative_hypothesis(self) -> Dict[str, str]:
         """귀무가설과 대립가설 생성"""
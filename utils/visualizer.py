@@ -1,18 +1,274 @@
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
 import plotly.graph_objects as go
-import plotly.figure_factory as ff
+from plotly.colors import qualitative
+import plotly.io as pio
+from plotly.io.json import to_json_plotly
+from plotly.offline import get_plotlyjs_version
 from io import BytesIO
-from typing import Dict, List, Tuple, Optional, Union, Any
+from typing import Dict, List, NamedTuple, Tuple, Optional, Union, Any
 import base64
+import json
+from functools import lru_cache
+import math
+from scipy.stats import gaussian_kde
+
+from ._kde_numba import gaussian_kde_grid
+
+
+# 이보다 큰 그룹은 정확한 KDE 대신 격자 binning + FFT 합성곱 KDE 사용
+_BINNED_KDE_MIN_N = 5000
+
+
+def _binned_kde(data: np.ndarray, grid: np.ndarray) -> Optional[np.ndarray]:
+    """등간격 격자에서 평가한 가우시안 KDE의 binning + FFT 근사 (Scott 대역폭)
+    
+    데이터를 격자(대역폭의 1/16 간격이 되도록 세분화한 내부 격자)에 선형 binning한 뒤
+    가우시안 커널과의 합성곱을 FFT로 한 번에 계산하므로 O(N + M log M)으로 끝나며,
+    scipy.stats.gaussian_kde 대비 상대 오차는 1e-3 이하입니다.
+    grid는 np.linspace로 만든 등간격 격자여야 하고, 대역폭을 정할 수 없으면 None을 반환합니다.
+    """
+    n = len(data)
+    m = grid.size
+    bandwidth = float(np.std(data, ddof=1)) * n ** (-0.2)
+    if not bandwidth > 0.0 or m < 2:
+        return None
+    
+    # 내부 격자 간격이 대역폭의 1/16 이하가 되도록 세분화 (내부 격자 크기는 2^18 이하로 제한)
+    delta = (grid[-1] - grid[0]) / (m - 1)
+    refine = max(1, min(math.ceil(delta * 16 / bandwidth), (1 << 18) // m))
+    fine_size = (m - 1) * refine + 1
+    delta /= refine
+    
+    # 인접한 두 내부 격자점에 거리에 반비례하도록 가중치 배분 (선형 binning)
+    pos = (data - grid[0]) / delta
+    pos = pos[(pos >= 0) & (pos <= fine_size - 1)]
+    left = np.minimum(pos.astype(np.intp), fine_size - 2)
+    frac = pos - left
+    weights = (np.bincount(left, 1 - frac, minlength=fine_size)
+               + np.bincount(left + 1, frac, minlength=fine_size))
+    
+    # 대역폭의 8배까지 자른 가우시안 커널과 순환이 겹치지 않도록 0을 채운 FFT 합성곱
+    half = min(fine_size - 1, math.ceil(8 * bandwidth / delta))
+    kernel = np.exp(-0.5 * (np.arange(-half, half + 1) * (delta / bandwidth)) ** 2)
+    size = 1 << math.ceil(math.log2(fine_size + half + 1))
+    padded = np.zeros(size)
+    padded[:half + 1] = kernel[half:]
+    padded[size - half:] = kernel[:half]
+    density = np.fft.irfft(np.fft.rfft(weights, size) * np.fft.rfft(padded), size)[:fine_size:refine]
+    
+    return np.maximum(density, 0.0) / (n * bandwidth * math.sqrt(2 * math.pi))
+
+
+@lru_cache(maxsize=64)
+def _to_rgba(color: str, alpha: float) -> str:
+    """팔레트 색상('#RRGGBB' 또는 'rgb(r, g, b)')을 투명도를 적용한 'rgba(r,g,b,a)' 문자열로 변환 (색상별 한 번만 파싱)"""
+    if color.startswith('#'):
+        r, g, b = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+    else:
+        r, g, b = (int(float(c)) for c in color[color.index('(') + 1:-1].split(',')[:3])
+    return f"rgba({r},{g},{b},{alpha})"
+
+
+# 분포 플롯의 그룹 요약 통계 주석 텍스트 (_get_summary_dict의 그룹별 dict에 format_map으로 적용)
+_STATS_TMPL_VIOLIN = (
+    "<b>{그룹}</b><br>개수: {개수:.0f}<br>평균: {평균:.3f}<br>표준편차: {표준편차:.3f}<br>중앙값: {중앙값:.3f}"
+)
+_STATS_TMPL_HIST = "<b>{그룹}</b><br>평균: {평균:.3f}<br>표준편차: {표준편차:.3f}"
+_STATS_TMPL_RIDGE = "<b>{그룹}</b><br>평균: {평균:.3f}<br>표준편차: {표준편차:.3f}<br>N={개수:.0f}"
+_STATS_TMPL_BOX = "<b>{그룹}</b><br>개수: {개수:.0f}<br>평균: {평균:.3f}<br>중앙값: {중앙값:.3f}<br>IQR: {IQR:.3f}"
+
+
+def _make_stats_annotation(x, y, text: str, border_color: str = "white",
+                           arrow_color: Optional[str] = None, borderpad: int = 4) -> Dict[str, Any]:
+    """분포 플롯에 붙이는 그룹 요약 통계 주석 (반투명 검은 배경의 흰색 텍스트, arrow_color를 주면 화살표 표시)"""
+    annotation = dict(
+        x=x,
+        y=y,
+        text=text,
+        showarrow=arrow_color is not None,
+        font=dict(size=11, color="white"),  # 다크 테마에 맞춰 흰색 텍스트
+        bgcolor="rgba(0,0,0,0.6)",  # 반투명 검은 배경으로 가독성 향상
+        bordercolor=border_color,
+        borderwidth=1,
+        borderpad=borderpad
+    )
+    if arrow_color is not None:
+        annotation.update(arrowhead=1, arrowcolor=arrow_color)
+    return annotation
+
+
+# 효과 크기 게이지 색상 (두 게이지 템플릿이 같은 문자열 객체를 공유)
+_RED = "#EF5350"
+_ORANGE = "#FFA726"
+_YELLOW = "#FFEE58"
+_GRAY = "#E0E0E0"
+_GREEN = "#66BB6A"
+_BLUE = "#1E88E5"
+_WHITE = "white"
+_BLACK = "black"
+
+# 효과 크기 게이지의 고정 설정 (모두 튜플로 만들어 모듈 로드 시 한 번만 할당하고 호출 간에 공유)
+_RANGE_COHEN = (-1.5, 1.5)
+_THRESHOLDS_COHEN = (-1.2, -0.8, -0.5, -0.2, 0.2, 0.5, 0.8, 1.2)
+_STEPS_COHEN = (
+    {"range": (-1.5, -0.8), "color": _RED},
+    {"range": (-0.8, -0.5), "color": _ORANGE},
+    {"range": (-0.5, -0.2), "color": _YELLOW},
+    {"range": (-0.2, 0.2), "color": _GRAY},
+    {"range": (0.2, 0.5), "color": _YELLOW},
+    {"range": (0.5, 0.8), "color": _ORANGE},
+    {"range": (0.8, 1.5), "color": _GREEN}
+)
+_RANGE_ETA = (0, 0.3)
+_THRESHOLDS_ETA = (0, 0.01, 0.06, 0.14, 0.25)
+_STEPS_ETA = (
+    {"range": (0, 0.01), "color": _GRAY},
+    {"range": (0.01, 0.06), "color": _YELLOW},
+    {"range": (0.06, 0.14), "color": _ORANGE},
+    {"range": (0.14, 0.3), "color": _GREEN}
+)
+_GAUGE_DOMAIN = {"x": (0, 1), "y": (0, 1)}
+_NUMBER_COHEN = {"font": {"size": 28}}
+_NUMBER_ETA = {"valueformat": ".3f", "font": {"size": 28}}
+
+# 게이지 템플릿 (호출 시에는 threshold 값만 채움)
+_COHEN_GAUGE_TEMPLATE = {
+    "axis": {"range": _RANGE_COHEN, "tickvals": _THRESHOLDS_COHEN},
+    "bar": {"color": _BLUE},
+    "steps": _STEPS_COHEN
+}
+_ETA_GAUGE_TEMPLATE = {
+    "axis": {"range": _RANGE_ETA, "tickvals": _THRESHOLDS_ETA},
+    "bar": {"color": _BLUE},
+    "steps": _STEPS_ETA
+}
+_GAUGE_THRESHOLD = {"line": {"color": _BLACK, "width": 4}, "thickness": 0.75}
+
+
+class _GaugeConfig(NamedTuple):
+    """효과 크기 측도별 게이지 설정 (숫자 표시 형식과 게이지 템플릿만 다름)"""
+    number: Dict[str, Any]
+    gauge: Dict[str, Any]
+
+
+# 효과 크기 측도별 게이지 설정 (알 수 없는 측도는 Eta-squared 설정으로 표시)
+_GAUGE_CONFIGS = {
+    "Cohen's d": _GaugeConfig(_NUMBER_COHEN, _COHEN_GAUGE_TEMPLATE),  # 두 그룹 비교
+    "Eta-squared": _GaugeConfig(_NUMBER_ETA, _ETA_GAUGE_TEMPLATE)     # 3개 이상 그룹 비교
+}
+
+# 간소화된 게이지 그림의 레이아웃
+_GAUGE_LAYOUT = {
+    "height": 300,
+    "width": 500,
+    "margin": {"l": 20, "r": 20, "t": 30, "b": 20},
+    "plot_bgcolor": _WHITE,
+    "paper_bgcolor": _WHITE
+}
+
+# render_effect_size_html의 HTML 조각 (Plotly.js는 설치된 plotly와 같은 버전을 CDN에서 로드)
+_GAUGE_HTML_TEMPLATE = (
+    '<script src="https://cdn.plot.ly/plotly-{version}.min.js" charset="utf-8"></script>'
+    '<div id="effect-size-gauge"></div>'
+    '<script>var spec = {spec}; Plotly.newPlot("effect-size-gauge", spec.data, spec.layout);</script>'
+)
+
+# 고정 설정은 모듈 로드 시 Indicator/Layout으로 한 번만 검증해 두고 (잘못된 값이면 여기서 ValueError),
+# 게이지 생성 시에는 Plotly 속성 검증을 건너뜀 (_validate=False)
+for _config in _GAUGE_CONFIGS.values():
+    go.Indicator(mode="gauge+number", number=_config.number, gauge={**_config.gauge, "threshold": _GAUGE_THRESHOLD},
+                 domain=_GAUGE_DOMAIN)
+go.Layout(_GAUGE_LAYOUT)
+
+
+@lru_cache(maxsize=32)
+def _annotation_text(interpretation: str) -> str:
+    """게이지 해석 주석 텍스트 (해석 라벨은 몇 가지뿐이므로 라벨별로 한 번만 생성)"""
+    return f"<b>해석: {interpretation}</b>"
+
+
+def _gauge_layout(interpretation: str) -> Dict[str, Any]:
+    """간소화된 게이지 레이아웃과 해석 주석"""
+    return {
+        **_GAUGE_LAYOUT,
+        "annotations": [{
+            "x": 0.5, "y": 0.2,
+            "xref": "paper", "yref": "paper",
+            "text": _annotation_text(interpretation),
+            "showarrow": False,
+            "font": {"size": 14}
+        }]
+    }
+
+
+@lru_cache(maxsize=256)
+def _build_effect_fig(measure: str, value: float, interpretation: str) -> go.Figure:
+    """효과 크기 게이지 차트 생성 (같은 측도/값/해석이면 캐시된 그림 재사용)
+    
+    반환되는 그림은 캐시에 담긴 객체이므로 호출자는 복사본을 사용해야 합니다.
+    """
+    config = _GAUGE_CONFIGS.get(measure, _GAUGE_CONFIGS["Eta-squared"])
+    indicator = {
+        "type": "indicator",
+        "mode": "gauge+number",
+        "value": value,
+        "number": config.number,
+        "gauge": {**config.gauge, "threshold": {**_GAUGE_THRESHOLD, "value": value}},
+        "domain": _GAUGE_DOMAIN
+    }
+    # 트레이스와 레이아웃을 dict 그대로 전달해 한 번에 생성 (고정 설정은 모듈 로드 시 검증됨)
+    return go.Figure(data=[indicator], layout=_gauge_layout(interpretation), _validate=False)
+
+
+# 게이지 JSON 템플릿을 만들 때 값/해석 자리에 넣는 표식 (그림의 다른 곳에 나오지 않는 값)
+_GAUGE_VALUE_MARK = 1234567.125
+_GAUGE_INTERPRETATION_MARK = "__INTERPRETATION__"
+
+
+def _gauge_json_template(measure: str) -> str:
+    """측도별 게이지 그림의 JSON에서 값과 해석 자리를 str.format 필드로 바꾼 템플릿 생성"""
+    fig = _build_effect_fig.__wrapped__(measure, _GAUGE_VALUE_MARK, _GAUGE_INTERPRETATION_MARK)
+    fig_json = pio.to_json(fig, validate=False)
+    template = fig_json.replace("{", "{{").replace("}", "}}")
+    
+    # 값은 게이지 숫자와 threshold 두 곳, 해석은 주석 한 곳에만 있어야 함
+    value_mark = to_json_plotly(_GAUGE_VALUE_MARK)
+    if template.count(value_mark) != 2 or template.count(_GAUGE_INTERPRETATION_MARK) != 1:
+        raise ValueError("게이지 JSON 템플릿을 만들 수 없습니다.")
+    return template.replace(value_mark, "{value}").replace(_GAUGE_INTERPRETATION_MARK, "{interpretation}")
+
+
+# 측도별 게이지 JSON 템플릿 (모듈 로드 시 한 번 직렬화해 두고, 호출 시에는 값과 해석만 채움)
+_EFFECT_JSON_TEMPLATES = {measure: _gauge_json_template(measure) for measure in _GAUGE_CONFIGS}
+
+
+# 값만 표시하는 최소 게이지 JSON (보고서 일괄 생성 등 레이아웃/주석이 필요 없는 경우)
+_MINIMAL_GAUGE_JSON = '{{"data":[{{"type":"indicator","mode":"number","value":{value}}}]}}'
+
+# 게이지 출력 상세 수준
+_GAUGE_DETAILS = ("full", "minimal")
+
+
+def _build_effect_fig_json(measure: str, value: float, interpretation: str, detail: str = "full") -> str:
+    """_build_effect_fig 그림의 JSON 문자열 (Plotly 그림 생성과 직렬화 없이 측도별 템플릿에 값만 채움)
+    
+    detail="minimal"이면 게이지, 레이아웃, 해석 주석 없이 값만 표시하는 indicator만 반환합니다.
+    """
+    if detail == "minimal":
+        return _MINIMAL_GAUGE_JSON.format(value=to_json_plotly(value))
+    
+    template = _EFFECT_JSON_TEMPLATES.get(measure, _EFFECT_JSON_TEMPLATES["Eta-squared"])
+    # 값과 해석도 Plotly JSON 인코더로 변환 (NaN은 null, '<' 등은 유니코드 이스케이프)
+    return template.format(value=to_json_plotly(value), interpretation=to_json_plotly(interpretation)[1:-1])
 
 
 class Visualizer:
     """A/B 테스트 결과를 시각화하는 클래스"""
     
+    # 개별 데이터 포인트를 그리는 플롯에서 그룹당 표시할 최대 점 수 (초과하면 무작위 표본 표시)
+    MAX_POINTS = 2000
+    
     def __init__(self, data_processor, statistical_tester, theme="streamlit"):
         """
         Args:
@@ -26,28 +282,121 @@ class Visualizer:
         
         # 기본 테마 설정
         if theme == "seaborn":
+            # seaborn(과 matplotlib)은 이 테마에서만 필요하므로 사용할 때 import
+            import seaborn as sns
             sns.set_theme(style="whitegrid")
         
         # 색상 팔레트 설정
-        self.color_palette = px.colors.qualitative.Plotly
+        self.color_palette = qualitative.Plotly
+        
+        # 그룹별 KDE 평가 결과 캐시 ((그룹, 격자 시작, 끝, 점 수) → 밀도 배열)
+        self._kde_cache = {}
+        self._kde_source = None
+        
+        # 그룹별 요약 통계 dict 캐시 (그룹 → {통계 이름: 값})
+        self._summary_dict = None
+        self._summary_source = None
+        
+        # 등간격 격자 캐시 ((시작, 끝, 점 수) → 읽기 전용 배열)
+        self._grid_cache = {}
+    
+    def _cached_linspace(self, x_min: float, x_max: float, n: int) -> np.ndarray:
+        """np.linspace(x_min, x_max, n) 결과를 캐시해 반환 (다시 그릴 때 같은 범위면 배열 재사용)"""
+        key = (float(x_min), float(x_max), n)
+        grid = self._grid_cache.get(key)
+        if grid is None:
+            grid = np.linspace(x_min, x_max, n)
+            grid.setflags(write=False)  # 여러 플롯이 공유하므로 변경 방지
+            self._grid_cache[key] = grid
+        return grid
+    
+    def _get_summary_dict(self) -> Dict[Any, Dict[str, float]]:
+        """그룹별 요약 통계를 {그룹: {통계 이름: 값}} dict로 반환 (주석 생성 시 .loc 조회 없이 바로 접근)
+        
+        주석 템플릿(_STATS_TMPL_*)에서 쓰도록 그룹 이름('그룹')과 IQR도 함께 담아 둡니다.
+        """
+        summary = self.data_processor.get_group_summary()
+        
+        # 요약 통계가 다시 계산되면 새 데이터프레임이 되므로 그것으로 캐시 유효성 판단
+        if self._summary_source is not summary:
+            summary_dict = summary.to_dict(orient='index')
+            for group, group_stats in summary_dict.items():
+                group_stats['그룹'] = group
+                group_stats['IQR'] = group_stats['3사분위수'] - group_stats['1사분위수']
+            self._summary_dict = summary_dict
+            self._summary_source = summary
+        
+        return self._summary_dict
+    
+    def _get_kde_curve(self, group, x_grid: np.ndarray) -> np.ndarray:
+        """그룹 데이터의 KDE를 x_grid에서 평가한 값 반환 (같은 데이터와 격자면 캐시 재사용)
+        
+        히스토그램과 Ridgeline 플롯이 같은 격자를 쓰므로 한 번 계산한 곡선을 함께 사용하며,
+        데이터가 1개 이하라 KDE를 만들 수 없는 그룹은 0으로 채운 곡선을 반환합니다.
+        """
+        group_arrays = self.data_processor.get_group_arrays()
+        
+        # 그룹/타겟이 다시 설정되면 그룹 배열 dict가 새로 만들어지므로 그것으로 캐시 유효성 판단
+        if self._kde_source is not group_arrays:
+            self._kde_cache = {}
+            self._kde_source = group_arrays
+        
+        key = (group, float(x_grid[0]), float(x_grid[-1]), x_grid.size)
+        if key not in self._kde_cache:
+            data = group_arrays[group]
+            if len(data) > 1:
+                # 큰 그룹은 binning + FFT 근사, 그 밖에는 numba가 있으면 정렬 + 창 합산 JIT 커널,
+                # 없거나 대역폭을 정할 수 없으면 SciPy 사용
+                curve = _binned_kde(data, x_grid) if len(data) > _BINNED_KDE_MIN_N else None
+                if curve is None:
+                    curve = gaussian_kde_grid(data, x_grid)
+                if curve is None:
+                    curve = gaussian_kde(data)(x_grid)
+                self._kde_cache[key] = curve
+            else:
+                self._kde_cache[key] = np.zeros_like(x_grid)
+        
+        return self._kde_cache[key]
+    
+    def _sample_points(self, data: np.ndarray) -> np.ndarray:
+        """그룹 데이터가 MAX_POINTS개를 넘으면 원래 순서를 유지한 무작위 표본 반환 (같은 데이터면 항상 같은 표본)"""
+        if len(data) <= self.MAX_POINTS:
+            return data
+        
+        idx = np.random.default_rng(0).choice(len(data), self.MAX_POINTS, replace=False)
+        idx.sort()
+        return data[idx]
+    
+    def _points_title_suffix(self, group_data: Dict[Any, np.ndarray], shape_from_sample: bool = False) -> str:
+        """표본만 표시한 그룹이 있으면 제목에 덧붙일 안내 문구 반환
+        
+        shape_from_sample이 True면 점뿐 아니라 분포 모양(바이올린 등)도 표본으로 그렸음을 알립니다.
+        """
+        if any(len(data) > self.MAX_POINTS for data in group_data.values()):
+            if shape_from_sample:
+                return f" (그룹당 최대 {self.MAX_POINTS:,}개 무작위 표본으로 분포 모양과 점 표시)"
+            return f" (그룹당 최대 {self.MAX_POINTS:,}개 점 무작위 표본 표시)"
+        return ""
         
     def plot_distribution_comparison(self) -> go.Figure:
         """각 그룹의 데이터 분포 비교 시각화 (Plotly)"""
         if not self.data_processor.groups:
             raise ValueError("그룹 데이터가 설정되지 않았습니다.")
         
-        group_data = self.data_processor.get_group_data()
+        # 데이터 포인트를 표시하므로 float32 배열로 직렬화 크기 절감
+        # (그룹이 크면 바이올린 모양과 점 모두 MAX_POINTS개 무작위 표본으로 그리며 제목에 표시,
+        #  주석의 통계는 전체 데이터 기준)
+        group_data = self.data_processor.get_plot_arrays()
         
         # 플롯을 위한 데이터 준비
         fig = go.Figure()
+        traces = []
         
         for i, (group, data) in enumerate(group_data.items()):
-            # 커널 밀도 추정
-            kde_data = data.to_list()
-            
-            fig.add_trace(go.Violin(
-                x=[group] * len(kde_data),
-                y=kde_data,
+            # 그룹 위치는 x0 하나로 지정 (점마다 그룹 이름을 반복한 x 배열을 직렬화하지 않음)
+            traces.append(go.Violin(
+                x0=group,
+                y=self._sample_points(data),
                 name=group,
                 box_visible=True,
                 meanline_visible=True,
@@ -59,10 +408,13 @@ class Visualizer:
                 jitter=0.05,   # 데이터 포인트 지터링 (선택 사항)
                 pointpos=-0.1  # 데이터 포인트 위치 조정 (선택 사항)
             ))
+        
+        # 트레이스는 한 번에 추가 (트레이스마다 검증/병합을 반복하지 않음)
+        fig.add_traces(traces)
 
         # 대시보드 레이아웃 설정
         fig.update_layout(
-            title=f"{self.data_processor.target_col} 그룹별 분포 비교",
+            title=f"{self.data_processor.target_col} 그룹별 분포 비교{self._points_title_suffix(group_data, shape_from_sample=True)}",
             xaxis_title="그룹",
             yaxis_title=self.data_processor.target_col,
             violingap=0.3,           # 바이올린 플롯 간 간격 추가
@@ -72,35 +424,14 @@ class Visualizer:
         )
         
         # 각 그룹의 요약 통계를 주석으로 추가
-        summary = self.data_processor.get_group_summary()
-        annotations = []
-        
-        for i, group in enumerate(self.data_processor.groups):
-            group_stats = summary.loc[group]
-            stats_text = (
-                f"<b>{group}</b><br>"
-                f"개수: {group_stats['개수']:.0f}<br>"
-                f"평균: {group_stats['평균']:.3f}<br>"
-                f"표준편차: {group_stats['표준편차']:.3f}<br>"
-                f"중앙값: {group_stats['중앙값']:.3f}"
+        summary = self._get_summary_dict()
+        fig.update_layout(annotations=[
+            _make_stats_annotation(
+                group, summary[group]['최대값'] * 1.1,  # 위치 약간 조정
+                _STATS_TMPL_VIOLIN.format_map(summary[group])
             )
-            
-            annotations.append(dict(
-                x=group,
-                y=group_stats['최대값'] * 1.1,  # 위치 약간 조정
-                text=stats_text,
-                showarrow=False,
-                font=dict(
-                    size=11,
-                    color="white"  # 다크 테마에 맞춰 흰색 텍스트
-                ),
-                bgcolor="rgba(0,0,0,0.6)",  # 반투명 검은 배경으로 가독성 향상
-                bordercolor="white",
-                borderwidth=1,
-                borderpad=4
-            ))
-        
-        fig.update_layout(annotations=annotations)
+            for group in self.data_processor.groups
+        ])
         
         return fig
     
@@ -109,44 +440,50 @@ class Visualizer:
         if not self.data_processor.groups:
             raise ValueError("그룹 데이터가 설정되지 않았습니다.")
         
-        group_data = self.data_processor.get_group_data()
+        group_data = self.data_processor.get_group_arrays()
         
         # 플롯을 위한 데이터 준비
         fig = go.Figure()
         
         # 히스토그램 빈(bin) 수 계산 - 모든 데이터에 공통으로 적용
-        all_data = []
-        for data in group_data.values():
-            all_data.extend(data.tolist())
+        # (그룹 순서대로 이어진 값 배열을 그대로 사용하므로 파이썬 리스트 변환이나 복사 없음)
+        all_data = self.data_processor.get_stacked_data()[0]
         
         # Sturges 공식 사용하여 빈 수 계산
-        import numpy as np
-        bins = int(np.ceil(np.log2(len(all_data)) + 1))
+        bins = int(np.ceil(np.log2(all_data.size) + 1))
+        
+        # KDE 평가 격자와 히스토그램 빈 경계 (모든 그룹 공통)
+        x_min, x_max = all_data.min(), all_data.max()
+        kde_x = self._cached_linspace(x_min, x_max, 500)
+        edges = self._cached_linspace(x_min, x_max, bins + 1)
+        centers = (edges[:-1] + edges[1:]) / 2
+        widths = np.diff(edges)
         
         # 각 그룹별로 히스토그램과 KDE 그리기
+        max_y = 0.0
+        traces = []
         for i, (group, data) in enumerate(group_data.items()):
             color = self.color_palette[i % len(self.color_palette)]
             
-            # 히스토그램
-            fig.add_trace(go.Histogram(
-                x=data,
+            # 히스토그램: 빈 도수를 서버에서 계산해 막대로 그림 (원본 데이터 대신 빈 수만큼의 값만 전송)
+            counts, _ = np.histogram(data, bins=edges)
+            density = counts / (counts.sum() * widths)  # 확률 밀도로 정규화
+            max_y = max(max_y, density.max())
+            
+            traces.append(go.Bar(
+                x=centers,
+                y=density,
+                width=widths,
                 name=f"{group} (히스토그램)",
                 opacity=0.5,
                 marker_color=color,
-                nbinsx=bins,
-                histnorm='probability density',  # 확률 밀도로 정규화
                 showlegend=True
             ))
             
-            # KDE (커널 밀도 추정)
-            import numpy as np
-            from scipy import stats
-            
-            kde_x = np.linspace(min(all_data), max(all_data), 500)
-            kde = stats.gaussian_kde(data)
-            kde_y = kde(kde_x)
+            # KDE (커널 밀도 추정, 같은 데이터/격자면 캐시 재사용)
+            kde_y = self._get_kde_curve(group, kde_x)
             
-            fig.add_trace(go.Scatter(
+            traces.append(go.Scatter(
                 x=kde_x,
                 y=kde_y,
                 mode='lines',
@@ -155,6 +492,8 @@ class Visualizer:
                 showlegend=True
             ))
         
+        fig.add_traces(traces)
+        
         # 레이아웃 설정
         fig.update_layout(
             title=f"{self.data_processor.target_col} 그룹별 분포 비교",
@@ -174,16 +513,15 @@ class Visualizer:
         )
         
         # 각 그룹의 요약 통계를 주석으로 추가
-        summary = self.data_processor.get_group_summary()
+        summary = self._get_summary_dict()
+        shapes = []
         annotations = []
         
-        max_y = fig.data[0].y.max()  # 첫 번째 히스토그램의 최대 높이
-        for i, (trace1, trace2) in enumerate(zip(fig.data[::2], fig.data[1::2])):  # 히스토그램과 KDE 쌍으로 순회
-            group = self.data_processor.groups[i]
-            group_stats = summary.loc[group]
+        for i, group in enumerate(self.data_processor.groups):
+            group_stats = summary[group]
             
             # 평균선 추가
-            fig.add_shape(
+            shapes.append(dict(
                 type="line",
                 x0=group_stats['평균'],
                 y0=0,
@@ -194,31 +532,19 @@ class Visualizer:
                     width=2,
                     dash="dash",
                 ),
-            )
+            ))
             
             # 통계 주석 추가
-            annotations.append(dict(
-                x=group_stats['평균'],
-                y=max_y * (0.95 - i * 0.15),  # 겹치지 않도록 조정
-                text=(
-                    f"<b>{group}</b><br>"
-                    f"평균: {group_stats['평균']:.3f}<br>"
-                    f"표준편차: {group_stats['표준편차']:.3f}"
-                ),
-                showarrow=True,
-                arrowhead=1,
-                arrowcolor=self.color_palette[i % len(self.color_palette)],
-                font=dict(
-                    size=11,
-                    color="white"
-                ),
-                bgcolor="rgba(0,0,0,0.6)",
-                bordercolor=self.color_palette[i % len(self.color_palette)],
-                borderwidth=1,
-                borderpad=4
+            color = self.color_palette[i % len(self.color_palette)]
+            annotations.append(_make_stats_annotation(
+                group_stats['평균'],
+                max_y * (0.95 - i * 0.15),  # 겹치지 않도록 조정
+                _STATS_TMPL_HIST.format_map(group_stats),
+                border_color=color,
+                arrow_color=color
             ))
         
-        fig.update_layout(annotations=annotations)
+        fig.update_layout(shapes=shapes, annotations=annotations)
         
         return fig
 
@@ -227,35 +553,22 @@ class Visualizer:
         if not self.data_processor.groups:
             raise ValueError("그룹 데이터가 설정되지 않았습니다.")
         
-        group_data = self.data_processor.get_group_data()
+        group_data = self.data_processor.get_group_arrays()
         
-        # Ridgeline Plot을 위한 데이터 준비
-        import numpy as np
-        from scipy import stats
+        # 모든 데이터 범위 계산 (그룹 순서대로 이어진 값 배열에서 바로 계산)
+        all_data = self.data_processor.get_stacked_data()[0]
         
-        # 모든 데이터 범위 계산
-        all_data = []
-        for data in group_data.values():
-            all_data.extend(data.tolist())
+        x_min, x_max = all_data.min(), all_data.max()
+        x_range = self._cached_linspace(x_min, x_max, 500)
         
-        x_min, x_max = min(all_data), max(all_data)
-        x_range = np.linspace(x_min, x_max, 500)
-        
-        # 각 그룹의 KDE 계산
-        kde_data = {}
-        for group, data in group_data.items():
-            if len(data) > 1:  # 충분한 데이터가 있는 경우에만 KDE 계산
-                kde = stats.gaussian_kde(data)
-                kde_data[group] = kde(x_range)
-            else:
-                # 데이터가 부족한 경우 더미 데이터 생성
-                kde_data[group] = np.zeros_like(x_range)
+        # 각 그룹의 KDE 계산 (히스토그램과 같은 격자이므로 캐시 재사용, 데이터가 부족하면 0)
+        kde_data = {group: self._get_kde_curve(group, x_range) for group in group_data}
         
         # KDE 최대값 찾기 (정규화를 위해)
         max_density = max([max(kde) for kde in kde_data.values()]) if kde_data else 1
         
         # 각 그룹별 통계 가져오기
-        summary = self.data_processor.get_group_summary()
+        summary = self._get_summary_dict()
         
         # 플롯 생성
         fig = go.Figure()
@@ -263,57 +576,55 @@ class Visualizer:
         # 각 그룹별 Ridgeline 추가
         y_offset = 0
         y_step = 1.0  # 각 분포 간 간격
+        traces = []
+        shapes = []
+        annotations = []
         
         for i, (group, kde_y) in enumerate(kde_data.items()):
             # 색상 설정
             color = self.color_palette[i % len(self.color_palette)]
             
             # KDE 곡선 추가
-            fig.add_trace(go.Scatter(
+            traces.append(go.Scatter(
                 x=x_range,
                 y=kde_y / max_density * y_step * 0.9 + y_offset,  # 정규화 및 오프셋 적용
                 mode='lines',
                 fill='tozeroy',
                 name=group,
                 line=dict(color=color, width=2),
-                fillcolor=f'rgba{tuple(int(c) for c in color[4:-1].split(",")) + (0.5,)}'  # 색상 투명도 조정
+                fillcolor=_to_rgba(color, 0.5)  # 색상 투명도 조정
             ))
             
             # 평균선 추가
-            group_mean = summary.loc[group]['평균']
-            fig.add_shape(
+            group_stats = summary[group]
+            group_mean = group_stats['평균']
+            shapes.append(dict(
                 type="line",
                 x0=group_mean,
                 y0=y_offset,
                 x1=group_mean,
                 y1=y_offset + (max(kde_y) / max_density * y_step * 0.9),
                 line=dict(color=color, width=2, dash="dot"),
-            )
+            ))
             
             # 통계 정보 주석 추가
-            fig.add_annotation(
-                x=group_mean,
-                y=y_offset + (max(kde_y) / max_density * y_step * 0.9) * 0.7,
-                text=(
-                    f"<b>{group}</b><br>"
-                    f"평균: {group_mean:.3f}<br>"
-                    f"표준편차: {summary.loc[group]['표준편차']:.3f}<br>"
-                    f"N={summary.loc[group]['개수']:.0f}"
+            annotations.append(dict(
+                **_make_stats_annotation(
+                    group_mean,
+                    y_offset + (max(kde_y) / max_density * y_step * 0.9) * 0.7,
+                    _STATS_TMPL_RIDGE.format_map(group_stats),
+                    border_color=color,
+                    arrow_color=color,
+                    borderpad=3
                 ),
-                showarrow=True,
-                arrowhead=1,
-                arrowcolor=color,
-                font=dict(size=11, color="white"),
-                bgcolor="rgba(0,0,0,0.6)",
-                bordercolor=color,
-                borderwidth=1,
-                borderpad=3,
                 align="left"
-            )
+            ))
             
             # 다음 그룹을 위한 오프셋 증가
             y_offset += y_step
         
+        fig.add_traces(traces)
+        
         # 레이아웃 설정
         fig.update_layout(
             title=f"{self.data_processor.target_col} 그룹별 분포 비교 (Ridgeline Plot)",
@@ -331,6 +642,8 @@ class Visualizer:
             ),
             height=100 + 150 * len(group_data),  # 그룹 수에 따라 높이 조정
             margin=dict(l=50, r=50, t=80, b=50),
+            shapes=shapes,
+            annotations=annotations,
         )
         
         return fig
@@ -340,15 +653,38 @@ class Visualizer:
         if not self.data_processor.groups:
             raise ValueError("그룹 데이터가 설정되지 않았습니다.")
         
-        group_data = self.data_processor.get_group_data()
+        # 데이터 포인트를 표시하므로 float32 배열로 직렬화 크기 절감
+        # (그룹이 크면 점은 MAX_POINTS개 무작위 표본만 그리고, 박스는 전체 데이터의 통계로 그림)
+        group_data = self.data_processor.get_plot_arrays()
+        summary = self._get_summary_dict()
         
         # 플롯을 위한 데이터 준비
         fig = go.Figure()
+        traces = []
         
         for i, (group, data) in enumerate(group_data.items()):
+            if len(data) > self.MAX_POINTS:
+                # 사분위수·평균은 전체 데이터의 요약 통계를, 수염은 Plotly 기본값과 같이
+                # 사분위수에서 1.5 IQR 안쪽의 가장 먼 값을 전체 데이터에서 구해 지정 (y는 점 표시용 표본)
+                group_stats = summary[group]
+                q1, q3 = group_stats['1사분위수'], group_stats['3사분위수']
+                iqr = q3 - q1
+                box_data = dict(
+                    x=[group],
+                    y=[self._sample_points(data)],
+                    q1=[q1],
+                    median=[group_stats['중앙값']],
+                    q3=[q3],
+                    lowerfence=[data[data >= q1 - 1.5 * iqr].min()],
+                    upperfence=[data[data <= q3 + 1.5 * iqr].max()],
+                    mean=[group_stats['평균']]
+                )
+            else:
+                box_data = dict(y=data)
+            
             # Box Plot 추가
-            fig.add_trace(go.Box(
-                y=data,
+            traces.append(go.Box(
+                **box_data,
                 name=group,
                 boxmean=True,  # 평균 표시
                 boxpoints='all',  # 모든 데이터 포인트 표시
@@ -361,9 +697,11 @@ class Visualizer:
                 line=dict(color=self.color_palette[i % len(self.color_palette)])
             ))
         
+        fig.add_traces(traces)
+        
         # 대시보드 레이아웃 설정
         fig.update_layout(
-            title=f"{self.data_processor.target_col} 그룹별 분포 비교 (Box Plot)",
+            title=f"{self.data_processor.target_col} 그룹별 분포 비교 (Box Plot){self._points_title_suffix(group_data)}",
             yaxis_title=self.data_processor.target_col,
             xaxis_title="그룹",
             template="plotly_dark",  # 다크 테마 적용
@@ -374,34 +712,15 @@ class Visualizer:
         )
         
         # 각 그룹의 요약 통계를 주석으로 추가
-        summary = self.data_processor.get_group_summary()
         annotations = []
         
-        y_max = max([max(data) for data in group_data.values()])
+        # 전체 데이터 최대값은 요약 통계에 이미 있으므로 표본을 다시 훑지 않음
+        y_max = max(group_stats['최대값'] for group_stats in summary.values())
         
         for i, group in enumerate(self.data_processor.groups):
-            group_stats = summary.loc[group]
-            stats_text = (
-                f"<b>{group}</b><br>"
-                f"개수: {group_stats['개수']:.0f}<br>"
-                f"평균: {group_stats['평균']:.3f}<br>"
-                f"중앙값: {group_stats['중앙값']:.3f}<br>"
-                f"IQR: {group_stats['3사분위수'] - group_stats['1사분위수']:.3f}"
-            )
-            
-            annotations.append(dict(
-                x=i,
-                y=y_max * 1.1,
-                text=stats_text,
-                showarrow=False,
-                font=dict(
-                    size=11,
-                    color="white"
-                ),
-                bgcolor="rgba(0,0,0,0.6)",
-                bordercolor=self.color_palette[i % len(self.color_palette)],
-                borderwidth=1,
-                borderpad=4
+            annotations.append(_make_stats_annotation(
+                i, y_max * 1.1, _STATS_TMPL_BOX.format_map(summary[group]),
+                border_color=self.color_palette[i % len(self.color_palette)]
             ))
         
         fig.update_layout(annotations=annotations)
@@ -418,19 +737,26 @@ class Visualizer:
         rows = (len(self.data_processor.groups) + cols - 1) // cols  # 올림 나눗셈
         
         fig = go.Figure()
+        traces = []
+        annotations = []
+        ref_xy = []  # 그룹별 참조선 구간 (None으로 끊어 한 트레이스에 담음)
         
         for i, group in enumerate(self.data_processor.groups):
             qq_data = self.statistical_tester.normality_results[group]["qq_plot"]
             theo_q = qq_data["theoretical_quantiles"]
             sample_q = qq_data["sample_quantiles"]
             
+            # 두 분위수 배열은 test_normality에서 오름차순으로 만들어지므로 양 끝 값이 최소/최대
+            theo_min, theo_max = theo_q[0], theo_q[-1]
+            sample_min, sample_max = sample_q[0], sample_q[-1]
+            
             # 정규성 검정 결과
             shapiro_result = self.statistical_tester.normality_results[group]["shapiro"]
             p_value = shapiro_result["p_value"]
             is_normal = shapiro_result["normal"]
             
             # QQ 플롯 생성
-            fig.add_trace(go.Scatter(
+            traces.append(go.Scatter(
                 x=theo_q,
                 y=sample_q,
                 mode='markers',
@@ -441,36 +767,39 @@ class Visualizer:
                 )
             ))
             
-            # 참조선 (y=x)
-            min_val = min(theo_q.min(), sample_q.min())
-            max_val = max(theo_q.max(), sample_q.max())
-            
-            fig.add_trace(go.Scatter(
-                x=[min_val, max_val],
-                y=[min_val, max_val],
-                mode='lines',
-                name=f"{group} - 참조선",
-                line=dict(
-                    color=self.color_palette[i % len(self.color_palette)],
-                    width=1,
-                    dash='dot'
-                ),
-                showlegend=False
-            ))
+            # 참조선 (y=x) 구간
+            ref_xy.extend((min(theo_min, sample_min), max(theo_max, sample_max), None))
             
             # 결과 주석 추가
-            fig.add_annotation(
-                x=theo_q.min() + (theo_q.max() - theo_q.min()) * 0.1,
-                y=sample_q.max() - (sample_q.max() - sample_q.min()) * 0.1,
+            annotations.append(dict(
+                x=theo_min + (theo_max - theo_min) * 0.1,
+                y=sample_max - (sample_max - sample_min) * 0.1,
                 text=(f"<b>{group}</b><br>"
                       f"Shapiro-Wilk p-value: {p_value:.4f}<br>"
                       f"정규성: {'만족' if is_normal else '불만족'}"),
                 showarrow=False,
                 font=dict(size=10, color=self.color_palette[i % len(self.color_palette)])
-            )
+            ))
+        
+        # 모든 그룹의 참조선을 None으로 끊긴 선분들로 이루어진 트레이스 하나로 표시 (y=x이므로 x, y가 같음)
+        traces.append(go.Scatter(
+            x=ref_xy,
+            y=ref_xy,
+            mode='lines',
+            name="참조선",
+            line=dict(
+                color='gray',
+                width=1,
+                dash='dot'
+            ),
+            connectgaps=False,
+            showlegend=False
+        ))
         
+        fig.add_traces(traces)
         fig.update_layout(
             title="그룹별 Q-Q 플롯 (정규성 검정)",
+            annotations=annotations,
             xaxis_title="이론적 분위수",
             yaxis_title="표본 분위수",
             template="plotly_white",
@@ -486,11 +815,12 @@ class Visualizer:
         if not self.data_processor.groups:
             raise ValueError("그룹 데이터가 설정되지 않았습니다.")
         
-        group_data = self.data_processor.get_group_data()
-        
-        # 평균 및 표준오차 계산
-        means = [data.mean() for data in group_data.values()]
-        stderrs = [data.sem() for data in group_data.values()]
+        # 평균 및 표준오차 계산 (미리 계산된 그룹별 통계 사용)
+        # (파이썬 리스트로 바꾸지 않고 NumPy 배열 그대로 Plotly에 전달)
+        moments = self.data_processor.get_group_moments()
+        means = moments["mean"].to_numpy()
+        stderrs = (moments["std"] / np.sqrt(moments["count"])).to_numpy()
+        label_offset = means.max() * 0.05
         
         # 그래프 데이터 생성
         fig = go.Figure()
@@ -512,7 +842,7 @@ class Visualizer:
         for i, (group, mean, stderr) in enumerate(zip(self.data_processor.groups, means, stderrs)):
             annotations.append(dict(
                 x=group,
-                y=mean + stderr + (max(means) * 0.05),
+                y=mean + stderr + label_offset,
                 text=f"{mean:.3f} ± {stderr:.3f}",
                 showarrow=False,
                 font=dict(size=10)
@@ -568,8 +898,7 @@ class Visualizer:
             interpretation = effect_size["interpretation"]
             comparison = effect_size["comparison"]
             
-            # 효과 크기의 임계값
-            thresholds = [-1.2, -0.8, -0.5, -0.2, 0.2, 0.5, 0.8, 1.2]
+            # 효과 크기 구간 라벨
             labels = ["매우 큰<br>음의 효과", "큰<br>음의 효과", "중간<br>음의 효과", "작은<br>음의 효과", 
                      "작은<br>양의 효과", "중간<br>양의 효과", "큰<br>양의 효과", "매우 큰<br>양의 효과"]
             
@@ -578,25 +907,8 @@ class Visualizer:
                 mode="gauge+number",
                 value=d_value,
                 title={"text": f"효과 크기 (Cohen's d)<br><sub>{comparison}</sub>"},
-                gauge={
-                    "axis": {"range": [-1.5, 1.5], "tickvals": thresholds},
-                    "bar": {"color": "#1E88E5"},
-                    "steps": [
-                        {"range": [-1.5, -0.8], "color": "#EF5350"},
-                        {"range": [-0.8, -0.5], "color": "#FFA726"},
-                        {"range": [-0.5, -0.2], "color": "#FFEE58"},
-                        {"range": [-0.2, 0.2], "color": "#E0E0E0"},
-                        {"range": [0.2, 0.5], "color": "#FFEE58"},
-                        {"range": [0.5, 0.8], "color": "#FFA726"},
-                        {"range": [0.8, 1.5], "color": "#66BB6A"}
-                    ],
-                    "threshold": {
-                        "line": {"color": "black", "width": 4},
-                        "thickness": 0.75,
-                        "value": d_value
-                    }
-                },
-                domain={"x": [0, 1], "y": [0, 1]}
+                gauge={**_COHEN_GAUGE_TEMPLATE, "threshold": {**_GAUGE_THRESHOLD, "value": d_value}},
+                domain=_GAUGE_DOMAIN
             ))
             
             # 해석 추가
@@ -613,8 +925,7 @@ class Visualizer:
             eta_value = effect_size["value"]
             interpretation = effect_size["interpretation"]
             
-            # 효과 크기 임계값
-            thresholds = [0, 0.01, 0.06, 0.14, 0.25]
+            # 효과 크기 구간 라벨
             labels = ["효과 없음", "작은 효과", "중간 효과", "큰 효과", "매우 큰 효과"]
             
             # 게이지 차트 생성
@@ -623,22 +934,8 @@ class Visualizer:
                 value=eta_value,
                 number={"valueformat": ".3f"},
                 title={"text": "효과 크기 (Eta-squared)"},
-                gauge={
-                    "axis": {"range": [0, 0.3], "tickvals": thresholds},
-                    "bar": {"color": "#1E88E5"},
-                    "steps": [
-                        {"range": [0, 0.01], "color": "#E0E0E0"},
-                        {"range": [0.01, 0.06], "color": "#FFEE58"},
-                        {"range": [0.06, 0.14], "color": "#FFA726"},
-                        {"range": [0.14, 0.3], "color": "#66BB6A"}
-                    ],
-                    "threshold": {
-                        "line": {"color": "black", "width": 4},
-                        "thickness": 0.75,
-                        "value": eta_value
-                    }
-                },
-                domain={"x": [0, 1], "y": [0, 1]}
+                gauge={**_ETA_GAUGE_TEMPLATE, "threshold": {**_GAUGE_THRESHOLD, "value": eta_value}},
+                domain=_GAUGE_DOMAIN
             ))
             
             # 해석 추가
@@ -665,22 +962,18 @@ class Visualizer:
         
         bootstrap_results = self.statistical_tester.bootstrap_results
         
-        # 각 그룹별 평균 및 신뢰구간
-        groups = []
-        means = []
-        ci_lowers = []
-        ci_uppers = []
-        
-        for group, result in bootstrap_results.items():
-            if group != "difference":  # difference는 별도로 처리
-                groups.append(group)
-                means.append(result["mean"])
-                ci_lowers.append(result["ci_lower"])
-                ci_uppers.append(result["ci_upper"])
+        # 각 그룹별 평균 및 신뢰구간 (difference는 별도로 처리)
+        items = [(group, result) for group, result in bootstrap_results.items() if group != "difference"]
+        groups = [group for group, _ in items]
+        estimates = np.fromiter(
+            (value for _, result in items for value in (result["mean"], result["ci_lower"], result["ci_upper"])),
+            dtype=np.float64, count=3 * len(items)
+        ).reshape(-1, 3)
+        means, ci_lowers, ci_uppers = estimates.T
         
         # 오차 범위 계산
-        error_minus = [mean - ci_low for mean, ci_low in zip(means, ci_lowers)]
-        error_plus = [ci_up - mean for mean, ci_up in zip(means, ci_uppers)]
+        error_minus = means - ci_lowers
+        error_plus = ci_uppers - means
         
         # 그래프 생성
         fig = go.Figure()
@@ -782,29 +1075,37 @@ class Visualizer:
             ["제1종 오류<br>(α)", "올바른 결정<br>(검정력, 1-β)"]
         ]
         
+        # 셀별 확률 문자열 (마우스오버와 셀 주석에서 함께 사용)
+        value_texts = np.array([[f"<b>{value:.3f}</b>" for value in row] for row in matrix_data], dtype=object)
+        
         # 히트맵 생성
-        fig = ff.create_annotated_heatmap(
+        fig = go.Figure(go.Heatmap(
             z=matrix_data,
             x=axis_labels,
             y=decision_labels,
-            annotation_text=annotations,
+            customdata=value_texts,
             colorscale='Blues',
-            showscale=True
-        )
+            showscale=True,
+            hovertemplate=(
+                "<b>결정:</b> %{y}<br>"
+                "<b>실제:</b> %{x}<br>"
+                "<b>확률:</b> %{customdata}<br>"
+                "<extra></extra>"
+            )
+        ))
         
-        # 매트릭스 값 추가
-        for i in range(2):
-            for j in range(2):
-                fig.data[0].customdata = np.zeros((2, 2), dtype=object)
-                value_text = f"<b>{matrix_data[i, j]:.3f}</b>"
-                fig.data[0].customdata[i, j] = value_text
-                
-                fig.data[0].hovertemplate = (
-                    "<b>결정:</b> %{y}<br>"
-                    "<b>실제:</b> %{x}<br>"
-                    "<b>확률:</b> %{customdata}<br>"
-                    "<extra></extra>"
-                )
+        # 셀 주석 (어두운 셀은 흰색, 밝은 셀은 검은색 글자)
+        midpoint = (matrix_data.min() + matrix_data.max()) / 2
+        fig.update_layout(annotations=[
+            dict(
+                x=axis_labels[j],
+                y=decision_labels[i],
+                text=f"{annotations[i][j]}<br>{value_texts[i, j]}",
+                showarrow=False,
+                font=dict(color="white" if matrix_data[i, j] > midpoint else "black")
+            )
+            for i in range(2) for j in range(2)
+        ])
         
         # 추가 정보 표시
         statistical_info = (
@@ -842,95 +1143,50 @@ class Visualizer:
         
         return fig
     
-    def create_effect_size_gauge(self) -> go.Figure:
-        """효과 크기만 시각화하는 간소화된 게이지 차트"""
+    def _effect_gauge_key(self) -> Tuple[str, float, str]:
+        """효과 크기 게이지 캐시 키 (측도, 소수 셋째 자리까지 반올림한 값, 해석)"""
         if not hasattr(self.statistical_tester, 'effect_size_results') or not self.statistical_tester.effect_size_results:
             self.statistical_tester.calculate_effect_size()
         
         effect_size = self.statistical_tester.effect_size_results
+        return effect_size["measure"], round(float(effect_size["value"]), 3), effect_size["interpretation"]
+    
+    def create_effect_size_gauge(self) -> go.Figure:
+        """효과 크기만 시각화하는 간소화된 게이지 차트
         
-        # Cohen's d 또는 Eta-squared에 따라 다른 시각화
-        if effect_size["measure"] == "Cohen's d":
-            # Cohen's d 시각화 (두 그룹 비교)
-            d_value = effect_size["value"]
-            interpretation = effect_size["interpretation"]
-            
-            # 효과 크기의 임계값
-            thresholds = [-1.2, -0.8, -0.5, -0.2, 0.2, 0.5, 0.8, 1.2]
-            
-            # 게이지 차트 생성
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=d_value,
-                number={"font": {"size": 28}},
-                gauge={
-                    "axis": {"range": [-1.5, 1.5], "tickvals": thresholds},
-                    "bar": {"color": "#1E88E5"},
-                    "steps": [
-                        {"range": [-1.5, -0.8], "color": "#EF5350"},
-                        {"range": [-0.8, -0.5], "color": "#FFA726"},
-                        {"range": [-0.5, -0.2], "color": "#FFEE58"},
-                        {"range": [-0.2, 0.2], "color": "#E0E0E0"},
-                        {"range": [0.2, 0.5], "color": "#FFEE58"},
-                        {"range": [0.5, 0.8], "color": "#FFA726"},
-                        {"range": [0.8, 1.5], "color": "#66BB6A"}
-                    ],
-                    "threshold": {
-                        "line": {"color": "black", "width": 4},
-                        "thickness": 0.75,
-                        "value": d_value
-                    }
-                },
-                domain={"x": [0, 1], "y": [0, 1]}
-            ))
-                
-        else:
-            # Eta-squared 시각화 (3개 이상 그룹 비교)
-            eta_value = effect_size["value"]
-            interpretation = effect_size["interpretation"]
-            
-            # 효과 크기 임계값
-            thresholds = [0, 0.01, 0.06, 0.14, 0.25]
-            
-            # 게이지 차트 생성
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=eta_value,
-                number={"valueformat": ".3f", "font": {"size": 28}},
-                gauge={
-                    "axis": {"range": [0, 0.3], "tickvals": thresholds},
-                    "bar": {"color": "#1E88E5"},
-                    "steps": [
-                        {"range": [0, 0.01], "color": "#E0E0E0"},
-                        {"range": [0.01, 0.06], "color": "#FFEE58"},
-                        {"range": [0.06, 0.14], "color": "#FFA726"},
-                        {"range": [0.14, 0.3], "color": "#66BB6A"}
-                    ],
-                    "threshold": {
-                        "line": {"color": "black", "width": 4},
-                        "thickness": 0.75,
-                        "value": eta_value
-                    }
-                },
-                domain={"x": [0, 1], "y": [0, 1]}
-            ))
+        같은 효과 크기(소수 셋째 자리까지 같은 값)면 캐시된 그림 객체를 그대로 반환하므로 여러 호출자가
+        같은 그림을 공유합니다. 수정이 필요하면 go.Figure(fig)로 복사해 사용해야 합니다.
+        (복사할 때마다 기본 레이아웃 템플릿을 다시 만드느라 수 ms가 걸리므로 공유 객체를 반환)
+        """
+        return _build_effect_fig(*self._effect_gauge_key())
+    
+    def create_effect_size_gauge_json(self, detail: str = "full") -> str:
+        """create_effect_size_gauge 그림의 JSON 문자열 (측도별 JSON 템플릿에 값만 채우므로 직렬화 없음)
         
-        # 간소화된 레이아웃
-        fig.update_layout(
-            height=300,
-            width=500,
-            margin=dict(l=20, r=20, t=30, b=20),
-            plot_bgcolor="white",
-            paper_bgcolor="white"
-        )
+        Args:
+            detail: 'full'이면 게이지 전체, 'minimal'이면 값만 표시하는 작은 JSON (PDF 내보내기 등)
+        """
+        if detail not in _GAUGE_DETAILS:
+            raise ValueError(f"지원하지 않는 상세 수준입니다: {detail} ('full' 또는 'minimal')")
+        return _build_effect_fig_json(*self._effect_gauge_key(), detail)
+    
+    def create_effect_size_gauge_dict(self, detail: str = "full") -> Dict[str, Any]:
+        """create_effect_size_gauge 그림을 {"data": [...], "layout": {...}} dict로 반환 (go.Figure 생성 없음)
         
-        # 해석 주석 추가
-        fig.add_annotation(
-            x=0.5, y=0.2,
-            xref="paper", yref="paper",
-            text=f"<b>해석: {interpretation}</b>",
-            showarrow=False,
-            font=dict(size=14)
-        )
+        JSON 템플릿을 파싱해 만들므로 호출마다 새 dict이며 fig.to_dict()와 같은 내용입니다.
+        Figure 복사는 기본 레이아웃 템플릿을 다시 만드느라 수 ms가 걸리지만 이 경로는 1 ms 미만입니다.
+        st.plotly_chart는 dict를 받으면 Figure로 다시 검증하므로 Streamlit에는 create_effect_size_gauge를 사용합니다.
         
-        return fig
+        Args:
+            detail: 'full'이면 게이지 전체, 'minimal'이면 {"data": [값 indicator]}만 반환
+        """
+        return json.loads(self.create_effect_size_gauge_json(detail))
+    
+    def render_effect_size_html(self) -> str:
+        """효과 크기 게이지를 Plotly.js로 바로 그리는 HTML 조각 (st.components.v1.html에 전달)
+        
+        캐시된 JSON을 그대로 스크립트에 넣으므로 Streamlit의 Figure 처리와 직렬화를 거치지 않습니다.
+        """
+        # Plotly JSON은 '<', '/'를 유니코드 이스케이프하므로 스크립트에 그대로 넣어도 태그가 닫히지 않음
+        spec = self.create_effect_size_gauge_json()
+        return _GAUGE_HTML_TEMPLATE.format(version=get_plotlyjs_version(), spec=spec)